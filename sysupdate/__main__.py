@@ -11,9 +11,34 @@ from contextlib import contextmanager
 
 from . import __version__
 
+# Seconds to wait on the non-interactive credential check before prompting
+SUDO_CHECK_TIMEOUT = 10.0
+
+
+def _sudo_cached() -> bool:
+    """Return True if sudo credentials are already cached (no prompt needed)."""
+    try:
+        result = subprocess.run(
+            ["sudo", "-n", "-v"],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=SUDO_CHECK_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
 
 def check_sudo() -> bool:
-    """Prompt for sudo credentials before starting."""
+    """Prompt for sudo credentials before starting.
+
+    Returns straight away when cached credentials are still valid, so the
+    prompt (and the interactive ``sudo -v``) only happens when needed.
+    """
+    if _sudo_cached():
+        return True
+
     from rich.markup import escape
 
     from .banner import DEFAULT_ACCENT, ERROR_STYLE
@@ -105,29 +130,45 @@ def cmd_self_update(args: argparse.Namespace) -> int:
     return asyncio.run(run_self_update(check_only=args.check_only))
 
 
+def _add_subcommands(parser: argparse.ArgumentParser) -> None:
+    """Attach the subcommand parsers (currently just self-update)."""
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # self-update subcommand
+    self_update_parser = subparsers.add_parser(
+        "self-update",
+        help="Check for and install sysupdate updates",
+    )
+    self_update_parser.add_argument(
+        "--check-only",
+        action="store_true",
+        help="Only check for updates without installing",
+    )
+
+
 def main() -> int:
     """Main entry point for sysupdate."""
     parser = argparse.ArgumentParser(
         prog="sysupdate",
         description="A beautiful CLI system update manager with multi-distro support (APT, DNF, Pacman, Flatpak, Snap).",
     )
-    parser.add_argument(
+    verbose = parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Show detailed package information",
     )
-    parser.add_argument(
+    version = parser.add_argument(
         "--version",
         action="version",
         version=f"%(prog)s {__version__}",
     )
-    parser.add_argument(
+    dry_run = parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show what would be updated without making changes",
     )
-    parser.add_argument(
+    no_animation = parser.add_argument(
         "--no-animation",
         action="store_true",
         default=bool(os.environ.get("SYSUPDATE_NO_ANIMATION")),
@@ -135,21 +176,21 @@ def main() -> int:
         " (also via SYSUPDATE_NO_ANIMATION=1)",
     )
 
-    # Add subparsers for commands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # self-update subcommand
-    self_update_parser = subparsers.add_parser(
-        "self-update",
-        help="Check for and install sysupdate updates",
-    )
-    self_update_parser.add_argument(
-        "--check-only",
-        action="store_true",
-        help="Only check for updates without installing",
-    )
-
-    args = parser.parse_args()
+    # The default update path takes only options, so the subcommand parsers
+    # are skipped when every argument is spelled exactly as one of them.
+    # Anything else (a positional, -h, an abbreviation like --he, or a
+    # short-flag cluster like -vh) may need them, e.g. to list them in help.
+    parser.set_defaults(command=None)
+    argv = sys.argv[1:]
+    plain_options = {
+        option
+        for action in (verbose, version, dry_run, no_animation)
+        for option in action.option_strings
+    }
+    if not all(arg in plain_options for arg in argv):
+        _add_subcommands(parser)
+
+    args = parser.parse_args(argv)
 
     # Handle subcommands or default behavior
     if args.command == "self-update":
@@ -1,25 +1,30 @@
 """Minimal CLI interface for System Update Manager using Rich."""
 
 import asyncio
+import logging
 import time
-from dataclasses import dataclass
-from typing import Callable
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any
 
 from rich.progress import (
     Progress,
+    ProgressColumn,
     TaskID,
     TextColumn,
     TimeElapsedColumn,
 )
+from rich.text import Text
 
 from . import __version__
 from .banner import WARNING_STYLE, show_banner
 from .console import console
 from .summary import print_summary
 from .ui import (
-    _MARKUP_PATTERN,
     BAR_WIDTH,
     DESC_WIDTH,
+    DescriptionColumn,
     ETAColumn,
     GradientBarColumn,
     PhaseAwareProgressColumn,
@@ -39,9 +44,47 @@ from .updaters.dnf import DnfUpdater
 from .updaters.flatpak import FlatpakUpdater
 from .updaters.pacman import PacmanUpdater
 from .updaters.snap import SnapUpdater
-from .utils.aria2 import prompt_install_aria2
 from .utils.logging import get_log_dir, setup_logging
 
+# Minimum seconds between applying queued progress to the rows (~30 Hz)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+# Seconds between repaints of the live progress display (10 FPS)
+PROGRESS_REFRESH_INTERVAL = 1 / 10
+
+# Queued progress update: the row's apply function and the reported state
+PendingProgress = tuple[Callable[[UpdateProgress], None], UpdateProgress]
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when uvloop is installed, else None."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+@lru_cache(maxsize=512)
+def _fit_desc(text: str) -> str:
+    """Pad or truncate marked-up text to exactly DESC_WIDTH cells.
+
+    The same few descriptions recur across updaters and runs of the
+    callback, so results are cached by the full marked-up text.
+    """
+    # Measure in terminal cells so wide glyphs and combining marks pad
+    # correctly; truncation keeps the markup instead of dropping it
+    styled = Text.from_markup(text)
+    width = styled.cell_len
+
+    if width < DESC_WIDTH:
+        # Pad to fixed width
+        return text + " " * (DESC_WIDTH - width)
+    elif width > DESC_WIDTH:
+        styled.truncate(DESC_WIDTH, overflow="ellipsis")
+        return styled.markup
+    return text
+
 
 @dataclass
 class UpdaterConfig:
@@ -50,6 +93,12 @@ class UpdaterConfig:
     updater: UpdaterProtocol
     label: str
     max_pkg_len: int = 12
+    # Fixed-width row description with no detail, shown before the first
+    # progress report and once the updater finishes
+    idle_desc: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.idle_desc = _fit_desc(f"[bold]{self.label}[/]")
 
 
 class SysUpdateCLI:
@@ -64,7 +113,10 @@ class SysUpdateCLI:
         self.verbose = verbose
         self.dry_run = dry_run
         self.console = console
-        self._logger = setup_logging(verbose)
+        # The main log file only ever receives errors, so without --verbose
+        # its directory and handler are set up on the first error instead
+        # of on every launch
+        self._main_logger = setup_logging(verbose) if verbose else None
         self._use_ascii = not self._supports_unicode()
         self._sep = "|" if self._use_ascii else "·"
         self._animate = not no_animation
@@ -76,6 +128,31 @@ class SysUpdateCLI:
             UpdaterConfig(PacmanUpdater(), "Pacman", max_pkg_len=12),
         ]
 
+    @property
+    def _logger(self) -> logging.Logger:
+        """The application logger, configured on first use."""
+        if self._main_logger is None:
+            self._main_logger = setup_logging(self.verbose)
+        return self._main_logger
+
+    @cached_property
+    def _progress_columns(self) -> tuple[ProgressColumn, ...]:
+        """Columns of the live progress display, built once per CLI.
+
+        They depend on the instance's ASCII mode, so they live on the
+        instance rather than the class. None of them hold per-task state.
+        """
+        return (
+            TextColumn("  "),
+            StatusColumn(use_ascii=self._use_ascii),
+            DescriptionColumn(),
+            GradientBarColumn(bar_width=BAR_WIDTH, use_ascii=self._use_ascii),
+            PhaseAwareProgressColumn(),
+            TimeElapsedColumn(),
+            SpeedColumn(),
+            ETAColumn(),
+        )
+
     def _supports_unicode(self) -> bool:
         """Check if the console supports Unicode output."""
         encoding = self.console.encoding
@@ -87,7 +164,13 @@ class SysUpdateCLI:
             if self.console.is_terminal:
                 self.console.set_window_title("sysupdate · updating…")
             self._print_header()
-            return asyncio.run(self._run_updates())
+            # uvloop, when installed, cuts per-callback overhead on the
+            # subprocess and progress fan-in; the stdlib loop is the default
+            loop_factory = _event_loop_factory()
+            if loop_factory is None:
+                return asyncio.run(self._run_updates())
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                return runner.run(self._run_updates())
         except KeyboardInterrupt:
             symbol = "!" if self._use_ascii else "⚡"
             dash = "--" if self._use_ascii else "—"
@@ -123,18 +206,7 @@ class SysUpdateCLI:
         else:
             text = f"{prefix}{label}"
 
-        # Calculate visible length (strip Rich markup)
-        visible = _MARKUP_PATTERN.sub("", text)
-        visible_len = len(visible)
-
-        if visible_len < DESC_WIDTH:
-            # Pad to fixed width
-            return text + " " * (DESC_WIDTH - visible_len)
-        elif visible_len > DESC_WIDTH:
-            # Truncate visible text and rebuild with markup
-            truncated_visible = visible[: DESC_WIDTH - 1] + "\u2026"
-            return truncated_visible
-        return text
+        return _fit_desc(text)
 
     def _create_progress_callback(
         self,
@@ -152,66 +224,86 @@ class SysUpdateCLI:
             max_pkg_len: Maximum length for package name display
         """
 
+        # Descriptions only change with the phase or the current package,
+        # so the fixed ones are formatted once per updater rather than on
+        # every progress tick.
+        head = f"[bold]{label}[/]"
+        idle_desc = self._format_desc("", head)
+        checking_desc = self._format_desc("", f"{head} [dim]{self._sep} checking[/]")
+        phase_descs = {
+            UpdatePhase.DOWNLOADING: self._format_desc(
+                "", f"{head} [dim]{self._sep} downloading[/]"
+            ),
+            UpdatePhase.INSTALLING: self._format_desc(
+                "", f"{head} [dim]{self._sep} installing[/]"
+            ),
+        }
+
+        @lru_cache(maxsize=64)
+        def message_desc(message: str) -> str:
+            # Extract short status from message (limit to 25 chars)
+            msg = message.rstrip(".")
+            if len(msg) > 25:
+                msg = msg[:24] + "\u2026"
+            return self._format_desc("", f"{head} [dim]{self._sep} {msg}[/]")
+
+        @lru_cache(maxsize=256)
+        def package_desc(package: str) -> str:
+            pkg = package[:max_pkg_len]
+            return self._format_desc("", f"{head} [dim]{self._sep}[/] {pkg}")
+
+        # Consecutive ticks usually name the same package; remember the
+        # last one so they skip the cache lookup entirely
+        last_pkg: str | None = None
+        last_pkg_desc = ""
+        # Fields last sent to Rich; identical ticks (a stalled download, a
+        # repeated status line) are dropped instead of re-laying out the row
+        last_fields: tuple[object, ...] | None = None
+
         def on_progress(update: UpdateProgress) -> None:
+            nonlocal last_pkg, last_pkg_desc, last_fields
             pct = int(update.progress * 100)
             phase_value = update.phase.value if update.phase else "checking"
 
             if update.phase == UpdatePhase.CHECKING:
                 # During checking, show pulse animation (don't set total/completed)
                 if update.message:
-                    # Extract short status from message (limit to 25 chars)
-                    msg = update.message.rstrip(".")
-                    if len(msg) > 25:
-                        msg = msg[:24] + "\u2026"
-                    desc = self._format_desc(
-                        "", f"[bold]{label}[/] [dim]{self._sep} {msg}[/]"
-                    )
+                    desc = message_desc(update.message)
                 else:
-                    desc = self._format_desc(
-                        "", f"[bold]{label}[/] [dim]{self._sep} checking[/]"
-                    )
+                    desc = checking_desc
+                fields: tuple[object, ...] = (desc, phase_value)
+                if fields == last_fields:
+                    return
+                last_fields = fields
                 # Keep total=None for pulse animation, only update description
                 progress.update(
                     task_id,
                     description=desc,
                     phase=phase_value,
                 )
-            elif update.phase in (UpdatePhase.DOWNLOADING, UpdatePhase.INSTALLING):
-                phase_text = (
-                    "downloading"
-                    if update.phase == UpdatePhase.DOWNLOADING
-                    else "installing"
-                )
-                if update.current_package:
-                    pkg = update.current_package[:max_pkg_len]
-                    desc = self._format_desc(
-                        "", f"[bold]{label}[/] [dim]{self._sep}[/] {pkg}"
-                    )
-                else:
-                    desc = self._format_desc(
-                        "", f"[bold]{label}[/] [dim]{self._sep} {phase_text}[/]"
-                    )
-                # Transition to determinate progress: set total and completed
-                progress.update(
-                    task_id,
-                    total=100,
-                    completed=pct,
-                    description=desc,
-                    phase=phase_value,
-                    speed=update.speed,
-                    eta=update.eta,
-                )
+                return
+
+            if update.current_package and update.phase in phase_descs:
+                if update.current_package != last_pkg:
+                    last_pkg = update.current_package
+                    last_pkg_desc = package_desc(last_pkg)
+                desc = last_pkg_desc
             else:
-                desc = self._format_desc("", f"[bold]{label}[/]")
-                progress.update(
-                    task_id,
-                    total=100,
-                    completed=pct,
-                    description=desc,
-                    phase=phase_value,
-                    speed=update.speed,
-                    eta=update.eta,
-                )
+                desc = phase_descs.get(update.phase, idle_desc)
+            fields = (pct, desc, phase_value, update.speed, update.eta)
+            if fields == last_fields:
+                return
+            last_fields = fields
+            # Transition to determinate progress: set total and completed
+            progress.update(
+                task_id,
+                total=100,
+                completed=pct,
+                description=desc,
+                phase=phase_value,
+                speed=update.speed,
+                eta=update.eta,
+            )
 
         return on_progress
 
@@ -219,52 +311,60 @@ class SysUpdateCLI:
         """Run all available package manager updates concurrently."""
         start_time = time.monotonic()
 
-        # Check for aria2c availability (for parallel APT downloads)
+        # Probe aria2c (for parallel APT downloads) and every updater at
+        # once, so startup waits on the slowest probe rather than their sum.
+        # A probe that raises is treated as "not available".
         downloader = Aria2Downloader()
-        aria2_available = await downloader.check_available()
-        if not aria2_available:
+        aria2_result, *availability = await asyncio.gather(
+            downloader.check_available(),
+            *[cfg.updater.check_available() for cfg in self._updaters],
+            return_exceptions=True,
+        )
+        if aria2_result is not True:
+            # Only pulls in rich.prompt and the installer helpers when needed
+            from .utils.aria2 import prompt_install_aria2
+
             await prompt_install_aria2(self.console)
 
-        # Check which updaters are available
-        availability = await asyncio.gather(
-            *[cfg.updater.check_available() for cfg in self._updaters]
-        )
         available_updaters = [
-            (cfg, avail) for cfg, avail in zip(self._updaters, availability)
+            (cfg, avail is True) for cfg, avail in zip(self._updaters, availability)
         ]
 
-        # Collect results by label, and failures as (label, message) pairs
-        results_by_label: dict[str, list[Package]] = {
-            cfg.label: [] for cfg in self._updaters
-        }
+        # Collect results by label, and failures as (label, message) pairs.
+        # Only updaters that succeed get an entry, added in config order
+        # since the tasks are read back in the order they were started;
+        # the summary skips empty sections anyway.
+        results_by_label: dict[str, list[Package]] = {}
         failures: list[tuple[str, str]] = []
 
         with Progress(
-            TextColumn("  "),
-            StatusColumn(use_ascii=self._use_ascii),
-            TextColumn("{task.description}"),
-            GradientBarColumn(bar_width=BAR_WIDTH, use_ascii=self._use_ascii),
-            PhaseAwareProgressColumn(),
-            TimeElapsedColumn(),
-            SpeedColumn(),
-            ETAColumn(),
+            *self._progress_columns,
             console=self.console,
             transient=False,
             expand=False,
+            # Repainted from the event loop by _refresh_progress instead of
+            # Rich's background thread
+            auto_refresh=False,
         ) as progress:
-            coroutines = []
-            labels = []
+            pending: list[tuple[str, Coroutine[Any, Any, UpdateResult]]] = []
+            # Shared by all updaters and drained by a single pump task.
+            # Off a terminal Rich only prints the final table when Progress
+            # stops, so intermediate progress is neither queued nor drawn.
+            queue: asyncio.Queue[PendingProgress] | None = (
+                asyncio.Queue() if self.console.is_terminal else None
+            )
 
             for cfg, is_available in available_updaters:
                 if is_available:
                     # Start with total=None for indeterminate pulse animation
                     task_id = progress.add_task(
-                        self._format_desc("", f"[bold]{cfg.label}[/]"),
+                        cfg.idle_desc,
                         total=None,
                         phase="checking",
                     )
-                    coroutines.append(self._run_updater(progress, task_id, cfg))
-                    labels.append(cfg.label)
+                    pending.append(
+                        (cfg.label, self._run_updater(progress, task_id, cfg, queue))
+                    )
 
             skipped = [cfg.label for cfg, avail in available_updaters if not avail]
             if skipped:
@@ -273,22 +373,34 @@ class SysUpdateCLI:
                     f"     [dim]Not available {self._sep} {', '.join(skipped)}[/]"
                 )
 
-            if coroutines:
+            if pending:
                 self.console.line()
-                results = await asyncio.gather(*coroutines, return_exceptions=True)
-
-                for label, result in zip(labels, results):
-                    if isinstance(result, Exception):
-                        self._logger.error(f"{label} update failed: {result}")
-                        failures.append((label, str(result) or type(result).__name__))
-                    elif isinstance(result, UpdateResult):
-                        if result.success:
-                            results_by_label[label] = result.packages
-                        else:
-                            self._logger.error(
-                                f"{label} update failed: {result.error_message}"
-                            )
-                            failures.append((label, result.error_message or ""))
+                # _run_updater turns exceptions into failed results, so one
+                # updater failing never cancels its siblings in the group
+                background = (
+                    [
+                        asyncio.create_task(self._pump_progress(queue)),
+                        asyncio.create_task(self._refresh_progress(progress)),
+                    ]
+                    if queue is not None
+                    else []
+                )
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        tasks = {label: tg.create_task(coro) for label, coro in pending}
+                finally:
+                    for task in background:
+                        task.cancel()
+
+                for label, task in tasks.items():
+                    result = task.result()
+                    if result.success:
+                        results_by_label[label] = result.packages
+                    else:
+                        self._logger.error(
+                            f"{label} update failed: {result.error_message}"
+                        )
+                        failures.append((label, result.error_message or ""))
 
         self.console.line(2)
         self._print_summary(
@@ -298,21 +410,88 @@ class SysUpdateCLI:
         )
         return 1 if failures else 0
 
+    @staticmethod
+    async def _pump_progress(queue: asyncio.Queue[PendingProgress]) -> None:
+        """Draw queued progress updates, collapsing any backlog to the latest.
+
+        One pump serves every updater. It runs until cancelled, redrawing at
+        most every PROGRESS_UPDATE_INTERVAL and applying only the newest
+        update per row, so a burst of ticks costs a single render.
+        """
+        while True:
+            apply, update = await queue.get()
+            latest = {apply: update}
+            while not queue.empty():
+                apply, update = queue.get_nowait()
+                latest[apply] = update
+            for apply, update in latest.items():
+                apply(update)
+            await asyncio.sleep(PROGRESS_UPDATE_INTERVAL)
+
+    @staticmethod
+    async def _refresh_progress(progress: Progress) -> None:
+        """Repaint the progress display every PROGRESS_REFRESH_INTERVAL.
+
+        Runs until cancelled. Painting from the loop, at a fixed cadence,
+        keeps the spinners and pulse bars moving while row updates only
+        change task state and never trigger a render themselves.
+        """
+        while True:
+            await asyncio.sleep(PROGRESS_REFRESH_INTERVAL)
+            progress.refresh()
+
     async def _run_updater(
         self,
         progress: Progress,
         task_id: TaskID,
         cfg: UpdaterConfig,
+        queue: asyncio.Queue[PendingProgress] | None,
     ) -> UpdateResult:
-        """Run an updater with progress tracking."""
-        on_progress = self._create_progress_callback(
+        """Run an updater, reporting its progress through the shared queue.
+
+        With no queue, intermediate progress is not requested at all and
+        only the final state of the row is set.
+        """
+        apply = self._create_progress_callback(
             progress, task_id, label=cfg.label, max_pkg_len=cfg.max_pkg_len
         )
+        finished = False
+
+        def apply_live(update: UpdateProgress) -> None:
+            # Updates still queued when the updater returns are stale
+            if not finished:
+                apply(update)
+
+        callback: Callable[[UpdateProgress], None] | None = None
+        if queue is not None:
+            q = queue
+            loop = asyncio.get_running_loop()
+
+            # Updaters only enqueue, so they never wait on Rich rendering
+            def on_progress(update: UpdateProgress) -> None:
+                item = (apply_live, update)
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    # Reported from a worker thread: asyncio.Queue is not
+                    # thread-safe, so hand the update over to the loop thread
+                    loop.call_soon_threadsafe(q.put_nowait, item)
+                    return
+                q.put_nowait(item)
+
+            callback = on_progress
 
-        result = await cfg.updater.run_update(
-            callback=on_progress,
-            dry_run=self.dry_run,
-        )
+        try:
+            result = await cfg.updater.run_update(
+                callback=callback, dry_run=self.dry_run
+            )
+        # One failing backend must become a failed result, not an exception
+        # that tears down the task group running the others
+        except Exception as e:  # noqa: BLE001
+            result = UpdateResult(
+                success=False, error_message=str(e) or type(e).__name__
+            )
+        finished = True
 
         # Ensure we transition to determinate mode and mark complete
         progress.update(
@@ -320,7 +499,7 @@ class SysUpdateCLI:
             total=100,
             completed=100,
             success=result.success,
-            description=self._format_desc("", f"[bold]{cfg.label}[/]"),
+            description=cfg.idle_desc,
         )
         return result
 
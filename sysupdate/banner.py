@@ -10,9 +10,12 @@ on terminals with smaller palettes.
 
 import math
 import time
+from functools import lru_cache
 
-from rich.console import Console
+from rich.color import Color
+from rich.console import Console, Group, RenderableType
 from rich.live import Live
+from rich.style import Style
 from rich.text import Text
 
 RGB = tuple[int, int, int]
@@ -114,6 +117,18 @@ def gradient_rgb(t: float) -> RGB:
     return blend_rgb(GRADIENT_STOPS[i], GRADIENT_STOPS[i + 1], x - i)
 
 
+@lru_cache(maxsize=4096)
+def rgb_style(color: RGB, extra: str = "") -> Style:
+    """Return a (cached) Style with a truecolor foreground.
+
+    Banner frames style every cell individually; building Style objects
+    directly, and reusing them, skips formatting and re-parsing a
+    '#rrggbb' style string for each cell of each frame.
+    """
+    style = Style(color=Color.from_rgb(*color))
+    return Style.parse(extra) + style if extra else style
+
+
 def _smoothstep(t: float) -> float:
     """Hermite ease between 0 and 1 (t clamped to [0, 1])."""
     t = min(max(t, 0.0), 1.0)
@@ -135,22 +150,22 @@ def _char_class(char: str, kind: str) -> str | None:
     return "shadow" if char in SHADOW_CHARS else "solid"
 
 
-def _cell_rgb(cls: str, diag: float, max_diag: float, sweep: float | None) -> RGB:
-    """Color for one character cell at diagonal position diag.
-
-    With sweep=None the cell shows its final gradient color; otherwise
-    the color depends on where the sheen band (at diagonal position
-    sweep) is relative to the cell: dark before it arrives, white-hot
-    at the band, full gradient after it has passed.
-    """
+def _cell_base_rgb(cls: str, diag: float, max_diag: float) -> RGB:
+    """Final gradient color of a character cell at diagonal position diag."""
     base = gradient_rgb(diag / max_diag if max_diag else 0.0)
     if cls == "shadow":
-        base = scale_rgb(base, SHADOW_LUMA)
-    elif cls == "text":
-        base = blend_rgb(base, TEXT_RGB, TEXT_TINT)
-    if sweep is None:
-        return base
-    delta = sweep - diag
+        return scale_rgb(base, SHADOW_LUMA)
+    if cls == "text":
+        return blend_rgb(base, TEXT_RGB, TEXT_TINT)
+    return base
+
+
+def _cell_rgb(cls: str, base: RGB, delta: float) -> RGB:
+    """Color for one cell whose sheen band is delta cells past it.
+
+    The cell is dark before the band arrives, white-hot at the band and
+    shows its full gradient color once the band has passed.
+    """
     revealed = blend_rgb(
         scale_rgb(base, UNREVEALED_LUMA), base, _smoothstep(delta / REVEAL_SPAN)
     )
@@ -179,39 +194,99 @@ def banner_rows(
     return rows
 
 
-def build_frame(rows: list[tuple[str, str]], sweep: float | None = None) -> Text:
-    """Render one frame of the banner as styled Rich Text."""
+# A banner cell: (char, class, diagonal position, final color)
+Cell = tuple[str, str | None, float, RGB]
+
+
+@lru_cache(maxsize=8)
+def _banner_cells(rows: tuple[tuple[str, str], ...]) -> tuple[tuple[Cell, ...], ...]:
+    """Classify and base-color every cell once per banner layout.
+
+    Only the sheen varies between animation frames, so the per-cell
+    classification and gradient lookup are shared by all of them.
+    """
     width = max(len(text) for text, _ in rows)
     max_diag = (width - 1) + (len(rows) - 1) * ROW_SLANT
-    frame = Text(no_wrap=True)
+    cells = []
     for row, (line, kind) in enumerate(rows):
+        row_cells = []
+        for col, char in enumerate(line):
+            cls = _char_class(char, kind)
+            diag = col + row * ROW_SLANT
+            base = _cell_base_rgb(cls, diag, max_diag) if cls else (0, 0, 0)
+            row_cells.append((char, cls, diag, base))
+        cells.append(tuple(row_cells))
+    return tuple(cells)
+
+
+def _render_frame(cells: tuple[tuple[Cell, ...], ...], sweep: float | None) -> Text:
+    """Paint banner cells, with the sheen band at diagonal position sweep.
+
+    Consecutive cells that share a style (the gaps between glyphs, and
+    neighbours whose colors round to the same RGB) go in as one run.
+    """
+    frame = Text(no_wrap=True)
+    for row, row_cells in enumerate(cells):
         if row:
             frame.append("\n")
-        if not line:
+        if not row_cells:
             continue
-        frame.append(" " * MARGIN)
-        for col, char in enumerate(line):
-            cls = _char_class(char, kind)
+        run = [" " * MARGIN]
+        run_style: Style | None = None
+        for char, cls, diag, base in row_cells:
             if cls is None:
-                frame.append(char)
-                continue
-            r, g, b = _cell_rgb(cls, col + row * ROW_SLANT, max_diag, sweep)
-            bold = "bold " if cls == "solid" else ""
-            frame.append(char, style=f"{bold}#{r:02x}{g:02x}{b:02x}")
+                style = None
+            else:
+                rgb = base if sweep is None else _cell_rgb(cls, base, sweep - diag)
+                style = rgb_style(rgb, "bold" if cls == "solid" else "")
+            # rgb_style is cached, so equal styles are the same object
+            if style is not run_style:
+                frame.append("".join(run), style=run_style)
+                run = []
+                run_style = style
+            run.append(char)
+        frame.append("".join(run), style=run_style)
     return frame
 
 
-def gradient_rule(width: int, use_ascii: bool, indent: int = 3) -> Text:
-    """A dimmed gradient hairline, used as a section rule in the summary."""
+@lru_cache(maxsize=8)
+def _final_frame(rows: tuple[tuple[str, str], ...]) -> Text:
+    """Build (once per layout) the fully revealed banner."""
+    return _render_frame(_banner_cells(rows), None)
+
+
+def build_frame(rows: list[tuple[str, str]], sweep: float | None = None) -> Text:
+    """Render one frame of the banner as styled Rich Text.
+
+    With sweep=None the fully revealed banner is returned; it never
+    changes for a given layout, so it is built once and copied.
+    """
+    key = tuple(rows)
+    if sweep is None:
+        return _final_frame(key).copy()
+    return _render_frame(_banner_cells(key), sweep)
+
+
+@lru_cache(maxsize=8)
+def _gradient_rule_text(width: int, use_ascii: bool, indent: int) -> Text:
+    """Build (once per shape) the gradient hairline behind gradient_rule."""
     char = "-" if use_ascii else "─"
     rule = Text(" " * indent, no_wrap=True)
     span = max(width - 1, 1)
     for i in range(width):
-        r, g, b = scale_rgb(gradient_rgb(i / span), 0.55)
-        rule.append(char, style=f"#{r:02x}{g:02x}{b:02x}")
+        rule.append(char, style=rgb_style(scale_rgb(gradient_rgb(i / span), 0.55)))
     return rule
 
 
+def gradient_rule(width: int, use_ascii: bool, indent: int = 3) -> Text:
+    """A dimmed gradient hairline, used as a section rule in the summary.
+
+    Rules are drawn above and below each section, so the styled text is
+    computed once per shape and a copy handed out on each call.
+    """
+    return _gradient_rule_text(width, use_ascii, indent).copy()
+
+
 def _select_logo(console_width: int, use_ascii: bool) -> list[str]:
     """Pick the block wordmark when it fits, the ASCII figlet otherwise."""
     if use_ascii or console_width < len(BLOCK_LOGO[0]) + MARGIN + 1:
@@ -253,8 +328,7 @@ def _sweep_line_frame(
             if sweep is not None:
                 glow = math.exp(-(((pos - sweep) / LINE_SHEEN_SIGMA) ** 2))
                 rgb = blend_rgb(base, SHEEN_RGB, glow * 0.9)
-            style = f"{extra} #{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}".strip()
-            line.append(char, style=style)
+            line.append(char, style=rgb_style(rgb, extra))
             pos += 1
     return line
 
@@ -302,15 +376,18 @@ def show_banner(
     """
     logo = _select_logo(console.width, use_ascii)
     rows = banner_rows(logo, version, use_ascii)
-    console.print()
-    if animate and console.is_terminal:
-        _animate(console, rows)
-    else:
-        console.print(build_frame(rows))
+    # Everything after the art goes out in a single print
+    tail: list[RenderableType] = []
     if dry_run:
         dash = "--" if use_ascii else "—"
-        console.print()
-        console.print(
+        tail.append(Text())
+        tail.append(
             f"   [bold {WARNING_STYLE}]DRY RUN[/] [dim]{dash} no changes will be made[/]"
         )
-    console.print()
+    tail.append(Text())
+    if animate and console.is_terminal:
+        console.print()
+        _animate(console, rows)
+        console.print(Group(*tail))
+    else:
+        console.print(Group(Text(), build_frame(rows), *tail))
@@ -64,6 +64,16 @@ async def run_self_update(check_only: bool = False) -> int:
     Returns:
         Exit code: 0 for success, 1 for error
     """
+    updater = SelfUpdater()
+
+    # The check and the download share one HTTP session, so the release
+    # lookup's connection (and TLS handshake) is reused for the assets
+    async with updater:
+        return await _run_self_update(updater, check_only)
+
+
+async def _run_self_update(updater: SelfUpdater, check_only: bool) -> int:
+    """Check for and install an update through *updater*'s open session."""
     from sysupdate import __version__
 
     from ..banner import (
@@ -82,8 +92,6 @@ async def run_self_update(check_only: bool = False) -> int:
     cross = "x" if use_ascii else "✗"
     up = "^" if use_ascii else "⬆"
 
-    updater = SelfUpdater()
-
     console.print()
     console.print(gradient_rule(48, use_ascii, indent=2))
     console.print()
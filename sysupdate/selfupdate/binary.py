@@ -5,12 +5,16 @@ import os
 import platform
 import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_architecture() -> str:
     """Detect system architecture.
 
+    The result is cached for the lifetime of the process.
+
     Returns:
         "x86_64" or "aarch64"
 
@@ -36,9 +40,12 @@ def get_architecture() -> str:
     return arch
 
 
+@lru_cache(maxsize=1)
 def get_binary_path() -> Path:
     """Find the current sysupdate binary path.
 
+    The result is cached for the lifetime of the process.
+
     Detection order:
     1. PYAPP environment variable (set by PyApp when PYAPP_PASS_LOCATION=true)
     2. Parent process /proc/<ppid>/exe (for some PyApp configurations)
@@ -78,18 +85,19 @@ def get_binary_path() -> Path:
     # Check parent process (for PyApp: the wrapper that spawned Python)
     # Note: This may not work if PyApp uses exec() which replaces the process
     ppid = os.getppid()
+    # The kernel has already resolved this magic link, so a single readlink
+    # returns the target without walking the path like resolve() would
     try:
-        parent_exe = Path(f"/proc/{ppid}/exe").resolve()
-        if parent_exe.name == "sysupdate":
-            return parent_exe
-    except (OSError, PermissionError):
+        parent_exe = os.readlink(f"/proc/{ppid}/exe")
+        if os.path.basename(parent_exe) == "sysupdate":
+            return Path(parent_exe)
+    except OSError:
         pass
 
     # Check sys.executable (for direct PyApp or venv installs)
-    if sys.executable:
-        exe_path = Path(sys.executable)
-        if exe_path.name in ("sysupdate", "sysupdate.exe"):
-            return exe_path
+    exe_name = os.path.basename(sys.executable) if sys.executable else ""
+    if exe_name in ("sysupdate", "sysupdate.exe"):
+        return Path(sys.executable)
 
     # Check PATH
     which_result = shutil.which("sysupdate")
@@ -123,12 +131,19 @@ def can_write_to_path(path: Path) -> bool:
     Returns:
         True if writable, False otherwise
     """
-    if not path.exists():
-        # Check parent directory
-        return can_write_to_path(path.parent) if path.parent != path else False
-
-    # For existing files/directories, check write permission
-    return os.access(path, os.W_OK)
+    # Walk up to the nearest existing ancestor and check write permission
+    # there, using one stat per level on the raw string path
+    current = os.fspath(path)
+    while True:
+        try:
+            os.stat(current)
+        except OSError:
+            parent = os.path.dirname(current) or "."
+            if parent == current:
+                return False
+            current = parent
+            continue
+        return os.access(current, os.W_OK)
 
 
 async def replace_binary(
@@ -173,20 +188,17 @@ async def replace_binary(
     # Check if we need sudo
     needs_sudo = not can_write_to_path(current_path)
 
-    # Create backup path (same directory as current)
-    backup_path = current_path.with_suffix(".bak")
-
     try:
         if needs_sudo:
-            # Use sudo for the entire operation
+            # Use sudo for the entire operation; the backup sits in the
+            # same directory as the current binary
+            backup_path = current_path.with_suffix(".bak")
             success, error = await _replace_with_sudo(
                 current_path, new_binary_path, backup_path
             )
         else:
             # Direct replacement without sudo
-            success, error = await _replace_direct(
-                current_path, new_binary_path, backup_path
-            )
+            success, error = await _replace_direct(current_path, new_binary_path)
 
         return success, error
 
@@ -194,12 +206,29 @@ async def replace_binary(
         return False, f"Unexpected error during binary replacement: {e}"
 
 
+# Backup, move and cleanup as one privileged script, so sudo (and its
+# authentication) runs once. Paths arrive as positional parameters:
+# $1 current binary, $2 new binary, $3 backup. Exit codes tell the
+# caller which step failed.
+_SUDO_REPLACE_SCRIPT = """
+mv -- "$1" "$3" || exit 10
+if ! mv -- "$2" "$1"; then
+    mv -- "$3" "$1"
+    exit 11
+fi
+rm -f -- "$3"
+exit 0
+"""
+_SUDO_BACKUP_FAILED = 10
+_SUDO_MOVE_FAILED = 11
+
+
 async def _replace_with_sudo(
     current_path: Path,
     new_binary_path: Path,
     backup_path: Path,
 ) -> tuple[bool, str]:
-    """Replace binary using sudo commands.
+    """Replace binary using a single sudo invocation.
 
     Args:
         current_path: Path to current binary
@@ -209,70 +238,41 @@ async def _replace_with_sudo(
     Returns:
         Tuple of (success, error_message)
     """
-    # Step 1: Backup current binary
     proc = await asyncio.create_subprocess_exec(
         "sudo",
-        "mv",
+        "sh",
+        "-c",
+        _SUDO_REPLACE_SCRIPT,
+        "sh",
         str(current_path),
+        str(new_binary_path),
         str(backup_path),
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
     _, stderr = await proc.communicate()
 
-    if proc.returncode != 0:
-        error = stderr.decode().strip() if stderr else "Failed to backup current binary"
-        return False, f"Backup failed: {error}"
-
-    # Step 2: Move new binary to target location
-    proc = await asyncio.create_subprocess_exec(
-        "sudo",
-        "mv",
-        str(new_binary_path),
-        str(current_path),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    _, stderr = await proc.communicate()
+    if proc.returncode == 0:
+        return True, ""
 
-    if proc.returncode != 0:
-        error = stderr.decode().strip() if stderr else "Failed to move new binary"
-        # Restore backup
-        restore_proc = await asyncio.create_subprocess_exec(
-            "sudo",
-            "mv",
-            str(backup_path),
-            str(current_path),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await restore_proc.communicate()
+    error = stderr.decode().strip() if stderr else ""
+    if proc.returncode == _SUDO_BACKUP_FAILED:
+        return False, f"Backup failed: {error or 'Failed to backup current binary'}"
+    if proc.returncode == _SUDO_MOVE_FAILED:
+        error = error or "Failed to move new binary"
         return False, f"Move failed: {error}. Backup restored."
-
-    # Step 3: Remove backup on success
-    proc = await asyncio.create_subprocess_exec(
-        "sudo",
-        "rm",
-        str(backup_path),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    await proc.communicate()
-
-    return True, ""
+    return False, f"Replacement failed: {error or 'sudo exited with an error'}"
 
 
 async def _replace_direct(
     current_path: Path,
     new_binary_path: Path,
-    backup_path: Path,
 ) -> tuple[bool, str]:
     """Replace binary directly without sudo.
 
     Args:
         current_path: Path to current binary
         new_binary_path: Path to new binary
-        backup_path: Path to backup current binary
 
     Returns:
         Tuple of (success, error_message)
@@ -282,25 +282,18 @@ async def _replace_direct(
         os.replace(new_binary_path, current_path)
         return True, ""
     except OSError:
-        # os.replace() fails across filesystems; fall back to backup-move-restore
+        # os.replace() fails across filesystems; fall back to staging a copy
         pass
 
+    # Copy next to the target so the final swap is still a single rename
+    # and the current binary is never missing, even if the copy fails
+    staged_path = current_path.with_name(f".{current_path.name}.new")
     try:
-        # Step 1: Backup current binary
-        shutil.move(str(current_path), str(backup_path))
-
-        # Step 2: Move new binary to target location
-        try:
-            shutil.move(str(new_binary_path), str(current_path))
-        except Exception as e:
-            # Restore backup on failure
-            shutil.move(str(backup_path), str(current_path))
-            return False, f"Move failed: {e}. Backup restored."
-
-        # Step 3: Remove backup on success
-        backup_path.unlink(missing_ok=True)
-
-        return True, ""
-
-    except Exception as e:
+        shutil.copy2(new_binary_path, staged_path)
+        os.replace(staged_path, current_path)
+    except OSError as e:
+        staged_path.unlink(missing_ok=True)
         return False, f"Direct replacement failed: {e}"
+
+    new_binary_path.unlink(missing_ok=True)
+    return True, ""
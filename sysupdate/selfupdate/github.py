@@ -3,24 +3,142 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
+import os
+import time
+from dataclasses import asdict, dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Callable
+from typing import Any, BinaryIO, Callable
 
 import aiohttp
 
+from .. import __version__
+from ..utils.cachefile import get_cache_dir, load_json, save_json
+
+try:
+    # Optional faster JSON parser; its errors subclass json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 GITHUB_API_BASE = "https://api.github.com"
 REPO_OWNER = "cosmix"
 REPO_NAME = "sysupdate"
 
+# Release assets are only ever served from here; cached asset URLs must match
+RELEASE_DOWNLOAD_PREFIX = (
+    f"https://github.com/{REPO_OWNER}/{REPO_NAME}/releases/download/"
+)
+
+# Sent with every request; GitHub asks API clients to identify themselves.
+# aiohttp already advertises (and transparently decodes) gzip/deflate.
+SESSION_HEADERS = {"User-Agent": f"sysupdate/{__version__}"}
+
+# Pins the REST API media type for api.github.com calls only; asset
+# downloads are plain files and keep the default Accept
+API_HEADERS = {"Accept": "application/vnd.github+json"}
+
 MAX_API_RESPONSE_BYTES = 2 * 1024 * 1024  # 2MB for JSON API responses
 MAX_BINARY_DOWNLOAD_BYTES = 200 * 1024 * 1024  # 200MB for binary downloads
 MAX_CHECKSUM_FILE_BYTES = 100 * 1024  # 100KB for SHA256SUMS
 
+# Read size for binary downloads; large reads keep per-chunk overhead
+# (loop wake-ups, bookkeeping) small relative to the bytes moved
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Downloaded chunks are buffered and handed to a worker thread in batches
+# of this size, so disk writes (and hashing) never block the event loop
+DOWNLOAD_WRITE_BATCH_BYTES = 256 * 1024
+
+
+# Binaries at least this large are fetched as DOWNLOAD_SEGMENTS parallel
+# byte ranges when the server accepts Range requests, so one stream's
+# slow start and per-connection throughput don't bound the download
+PARALLEL_DOWNLOAD_MIN_BYTES = 8 * 1024 * 1024
+DOWNLOAD_SEGMENTS = 4
+
+
+class _RangesNotHonored(Exception):
+    """A ranged request was not answered with the requested range."""
+
+
+def _write_batch(f: BinaryIO, data: bytes, hasher: hashlib._Hash | None) -> None:
+    """Hash and write one batch of downloaded bytes (runs in a worker thread)."""
+    if hasher is not None:
+        hasher.update(data)
+    f.write(data)
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    """Write all of *data* to *fd* at *offset* (runs in a worker thread)."""
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _hash_file(path: Path, hasher: hashlib._Hash) -> None:
+    """Feed the contents of *path* to *hasher* (runs in a worker thread)."""
+    with path.open("rb") as f:
+        while block := f.read(DOWNLOAD_WRITE_BATCH_BYTES):
+            hasher.update(block)
+
+
+def _progress_reporter(
+    total_size: int, progress_callback: Callable[[float, str], None] | None
+) -> Callable[[int], None]:
+    """Return a report(nbytes) function that tracks bytes received.
+
+    Progress is passed on once per whole percent, not per chunk.
+    """
+    downloaded = 0
+    reported_percent = -1
+
+    def report(nbytes: int) -> None:
+        nonlocal downloaded, reported_percent
+        downloaded += nbytes
+        if progress_callback and total_size > 0:
+            whole_percent = downloaded * 100 // total_size
+            if whole_percent != reported_percent:
+                reported_percent = whole_percent
+                progress_callback(
+                    (downloaded / total_size) * 100,
+                    f"Downloaded {downloaded}/{total_size} bytes",
+                )
+
+    return report
+
+
+async def _write_segment(
+    response: aiohttp.ClientResponse,
+    fd: int,
+    offset: int,
+    length: int,
+    report: Callable[[int], None],
+) -> None:
+    """Write the next *length* body bytes of *response* to *fd* at *offset*."""
+    pending = bytearray()
+    remaining = length
+    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+        chunk = chunk[:remaining]
+        pending += chunk
+        remaining -= len(chunk)
+        report(len(chunk))
+        if len(pending) >= DOWNLOAD_WRITE_BATCH_BYTES or not remaining:
+            data = bytes(pending)
+            pending.clear()
+            await asyncio.to_thread(_pwrite_all, fd, data, offset)
+            offset += len(data)
+        if not remaining:
+            return
+    raise aiohttp.ClientPayloadError(f"Segment ended {remaining} bytes early")
+
 
 @dataclass
 class ReleaseAsset:
@@ -41,6 +159,48 @@ class Release:
     assets: list[ReleaseAsset]
     prerelease: bool
 
+    @cached_property
+    def _assets_by_name(self) -> dict[str, ReleaseAsset]:
+        """Index of assets by name, built on first lookup."""
+        return {asset.name: asset for asset in self.assets}
+
+    def find_asset(self, name: str) -> ReleaseAsset | None:
+        """Return the asset called *name*, or None if the release has none."""
+        return self._assets_by_name.get(name)
+
+
+def get_release_cache_path() -> Path:
+    """Return the path of the latest-release cache file (without creating it)."""
+    return get_cache_dir() / "latest_release.json"
+
+
+def _cached_release(cache: dict[str, Any]) -> Release | None:
+    """Rebuild the cached Release, or None if there is no usable entry.
+
+    The cache file is only as trustworthy as the user's cache directory, so
+    an entry with any asset URL outside this repository's GitHub release
+    downloads is rejected rather than handed to the updater.
+    """
+    data = cache.get("release")
+    try:
+        release = Release(
+            tag_name=data["tag_name"],
+            version=data["version"],
+            name=data["name"],
+            assets=[ReleaseAsset(**asset) for asset in data["assets"]],
+            prerelease=bool(data["prerelease"]),
+        )
+    except (KeyError, TypeError):
+        return None
+    for asset in release.assets:
+        if not (
+            isinstance(asset.download_url, str)
+            and asset.download_url.startswith(RELEASE_DOWNLOAD_PREFIX)
+        ):
+            logger.warning("Ignoring cached release with untrusted asset URL")
+            return None
+    return release
+
 
 class GitHubClient:
     """Async GitHub API client for release operations."""
@@ -53,20 +213,33 @@ class GitHubClient:
         """
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self._session: aiohttp.ClientSession | None = None
+        self._depth = 0
 
     async def __aenter__(self) -> GitHubClient:
-        """Async context manager entry."""
-        self._session = aiohttp.ClientSession(timeout=self.timeout)
+        """Async context manager entry.
+
+        Entries nest: inner ones reuse the session (and its keep-alive
+        connections) opened by the outermost, which alone closes it.
+        """
+        if self._depth == 0:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout, headers=SESSION_HEADERS
+            )
+        self._depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
-        if self._session:
+        self._depth -= 1
+        if self._depth == 0 and self._session:
             await self._session.close()
             self._session = None
 
     async def _request_with_retry(
-        self, url: str, max_retries: int = 3
+        self,
+        url: str,
+        max_retries: int = 3,
+        headers: dict[str, str] | None = None,
     ) -> aiohttp.ClientResponse:
         """Make an HTTP GET request with exponential backoff retry.
 
@@ -76,6 +249,7 @@ class GitHubClient:
         Args:
             url: Request URL
             max_retries: Maximum number of attempts
+            headers: Optional extra request headers
 
         Returns:
             aiohttp.ClientResponse on success
@@ -90,7 +264,7 @@ class GitHubClient:
         last_error: BaseException | None = None
         for attempt in range(max_retries):
             try:
-                response = await self._session.get(url)
+                response = await self._session.get(url, headers=headers)
                 if response.status == 429 or response.status >= 500:
                     await response.release()
                     last_error = aiohttp.ClientResponseError(
@@ -134,6 +308,11 @@ class GitHubClient:
     async def get_latest_release(self) -> Release | None:
         """Get the latest release from GitHub.
 
+        The last answer is cached on disk with its ETag and revalidated
+        with a conditional request, so an unchanged release costs a bodyless
+        304. While GitHub reports the rate limit as exhausted, the cached
+        release is returned without making a request.
+
         Returns:
             Release object if successful, None otherwise
         """
@@ -142,10 +321,32 @@ class GitHubClient:
 
         url = f"{GITHUB_API_BASE}/repos/{REPO_OWNER}/{REPO_NAME}/releases/latest"
 
+        cache = load_json(get_release_cache_path())
+        cached = _cached_release(cache)
+        limited_until = cache.get("rate_limited_until")
+        if isinstance(limited_until, (int, float)) and time.time() < limited_until:
+            return cached
+
+        headers = dict(API_HEADERS)
+        etag = cache.get("etag")
+        if cached is not None and isinstance(etag, str):
+            headers["If-None-Match"] = etag
+
         try:
-            response = await self._request_with_retry(url)
+            response = await self._request_with_retry(url, headers=headers)
             try:
+                if response.status == 304 and cached is not None:
+                    return cached
+
                 if response.status != 200:
+                    reset = response.headers.get("X-RateLimit-Reset", "")
+                    if (
+                        response.headers.get("X-RateLimit-Remaining") == "0"
+                        and reset.isdigit()
+                    ):
+                        cache["rate_limited_until"] = int(reset)
+                        save_json(get_release_cache_path(), cache)
+                        return cached
                     return None
 
                 content_length = response.headers.get("content-length")
@@ -159,7 +360,7 @@ class GitHubClient:
                     return None
 
                 raw_body = await response.content.read(MAX_API_RESPONSE_BYTES)
-                data = json.loads(raw_body)
+                data = _json_loads(raw_body)
 
                 # Parse assets
                 assets = [
@@ -175,13 +376,21 @@ class GitHubClient:
                 tag_name = data["tag_name"]
                 version = tag_name.lstrip("v")
 
-                return Release(
+                release = Release(
                     tag_name=tag_name,
                     version=version,
                     name=data.get("name", ""),
                     assets=assets,
                     prerelease=data.get("prerelease", False),
                 )
+
+                etag = response.headers.get("ETag")
+                if etag:
+                    save_json(
+                        get_release_cache_path(),
+                        {"etag": etag, "release": asdict(release)},
+                    )
+                return release
             finally:
                 await response.release()
 
@@ -193,6 +402,7 @@ class GitHubClient:
         url: str,
         dest_path: Path,
         progress_callback: Callable[[float, str], None] | None = None,
+        hasher: hashlib._Hash | None = None,
     ) -> bool:
         """Download an asset from URL to destination path.
 
@@ -200,6 +410,8 @@ class GitHubClient:
             url: Download URL
             dest_path: Destination file path
             progress_callback: Optional callback(progress_percent, status_message)
+            hasher: Optional hash object fed the downloaded bytes, so a
+                single-stream download need not be read back to be verified
 
         Returns:
             True if download successful, False otherwise
@@ -233,39 +445,45 @@ class GitHubClient:
                         )
                     return False
 
-                downloaded = 0
-
                 # Ensure parent directory exists
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-                with dest_path.open("wb") as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        downloaded += len(chunk)
-                        if downloaded > MAX_BINARY_DOWNLOAD_BYTES:
-                            logger.error(
-                                "Binary download from %s exceeded size limit during transfer: "
-                                "%d bytes received > %d byte limit",
-                                url,
-                                downloaded,
-                                MAX_BINARY_DOWNLOAD_BYTES,
-                            )
-                            f.close()
-                            dest_path.unlink(missing_ok=True)
+                if (
+                    total_size >= PARALLEL_DOWNLOAD_MIN_BYTES
+                    and response.headers.get("Accept-Ranges") == "bytes"
+                ):
+                    # Every segment is its own Range request, so stop the
+                    # full-body response from streaming the whole file
+                    await response.release()
+                    try:
+                        await self._download_segments(
+                            url,
+                            dest_path,
+                            total_size,
+                            _progress_reporter(total_size, progress_callback),
+                        )
+                    except _RangesNotHonored:
+                        # Start over as a single stream on a fresh response
+                        logger.info("Ranged download of %s refused, retrying", url)
+                        response = await self._request_with_retry(url)
+                        if response.status != 200:
                             if progress_callback:
                                 progress_callback(
-                                    0.0,
-                                    f"Download aborted: {downloaded} bytes received exceeds "
-                                    f"{MAX_BINARY_DOWNLOAD_BYTES} byte limit",
+                                    0.0, f"Download failed: HTTP {response.status}"
                                 )
                             return False
-                        f.write(chunk)
-
-                        if progress_callback and total_size > 0:
-                            progress_percent = (downloaded / total_size) * 100
-                            progress_callback(
-                                progress_percent,
-                                f"Downloaded {downloaded}/{total_size} bytes",
-                            )
+                    else:
+                        # Segments land out of order, so hash the finished file
+                        if hasher is not None:
+                            await asyncio.to_thread(_hash_file, dest_path, hasher)
+                        if progress_callback:
+                            progress_callback(100.0, "Download complete")
+                        return True
+
+                if not await self._download_stream(
+                    url, response, dest_path, total_size, progress_callback, hasher
+                ):
+                    return False
 
                 if progress_callback:
                     progress_callback(100.0, "Download complete")
@@ -279,6 +497,103 @@ class GitHubClient:
                 progress_callback(0.0, "Download failed")
             return False
 
+    async def _download_stream(
+        self,
+        url: str,
+        response: aiohttp.ClientResponse,
+        dest_path: Path,
+        total_size: int,
+        progress_callback: Callable[[float, str], None] | None,
+        hasher: hashlib._Hash | None,
+    ) -> bool:
+        """Write the whole body of *response* to *dest_path* sequentially.
+
+        Returns:
+            True on success, False if the size limit was exceeded
+        """
+        downloaded = 0
+        report = _progress_reporter(total_size, progress_callback)
+        pending = bytearray()
+        with dest_path.open("wb") as f:
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                downloaded += len(chunk)
+                if downloaded > MAX_BINARY_DOWNLOAD_BYTES:
+                    logger.error(
+                        "Binary download from %s exceeded size limit during transfer: "
+                        "%d bytes received > %d byte limit",
+                        url,
+                        downloaded,
+                        MAX_BINARY_DOWNLOAD_BYTES,
+                    )
+                    f.close()
+                    dest_path.unlink(missing_ok=True)
+                    if progress_callback:
+                        progress_callback(
+                            0.0,
+                            f"Download aborted: {downloaded} bytes received exceeds "
+                            f"{MAX_BINARY_DOWNLOAD_BYTES} byte limit",
+                        )
+                    return False
+                pending += chunk
+                if len(pending) >= DOWNLOAD_WRITE_BATCH_BYTES:
+                    data = bytes(pending)
+                    pending.clear()
+                    await asyncio.to_thread(_write_batch, f, data, hasher)
+                report(len(chunk))
+
+            if pending:
+                await asyncio.to_thread(_write_batch, f, bytes(pending), hasher)
+        return True
+
+    async def _download_segments(
+        self,
+        url: str,
+        dest_path: Path,
+        total_size: int,
+        report: Callable[[int], None],
+    ) -> None:
+        """Download *url* to *dest_path* as parallel byte ranges.
+
+        Each segment is fetched with its own Range request and written at
+        its own offset.
+
+        Raises:
+            _RangesNotHonored: If a ranged request does not return its range
+        """
+        segment_size = -(-total_size // DOWNLOAD_SEGMENTS)
+        segments = [
+            (start, min(segment_size, total_size - start))
+            for start in range(0, total_size, segment_size)
+        ]
+
+        async def fetch(fd: int, start: int, length: int) -> None:
+            end = start + length - 1
+            ranged = await self._request_with_retry(
+                url, headers={"Range": f"bytes={start}-{end}"}
+            )
+            try:
+                content_range = ranged.headers.get("Content-Range", "")
+                if ranged.status != 206 or not content_range.startswith(
+                    f"bytes {start}-{end}/"
+                ):
+                    raise _RangesNotHonored(f"HTTP {ranged.status} {content_range}")
+                await _write_segment(ranged, fd, start, length, report)
+            finally:
+                await ranged.release()
+
+        fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            tasks = [asyncio.create_task(fetch(fd, *bounds)) for bounds in segments]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # One failed segment fails the download; stop the others
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            os.close(fd)
+
     async def download_text(self, url: str) -> str:
         """Download text content from URL.
 
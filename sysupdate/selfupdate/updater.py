@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import logging
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Self
 
 from packaging.version import InvalidVersion, Version
 
@@ -16,7 +19,7 @@ from .binary import (
     get_expected_asset_name,
     replace_binary,
 )
-from .checksum import compute_sha256, parse_sha256sums, verify_checksum
+from .checksum import parse_sha256sums
 from .github import GitHubClient, Release
 
 logger = logging.getLogger(__name__)
@@ -50,6 +53,15 @@ class SelfUpdater:
         """Initialize self-updater."""
         self._github_client = GitHubClient()
 
+    async def __aenter__(self) -> Self:
+        """Hold one GitHub session open across check and update."""
+        await self._github_client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the shared GitHub session."""
+        await self._github_client.__aexit__(exc_type, exc_val, exc_tb)
+
     async def check_for_update(self, current_version: str) -> UpdateCheckResult:
         """Check if a newer version is available on GitHub.
 
@@ -187,14 +199,8 @@ class SelfUpdater:
             if progress_callback:
                 progress_callback("Finding release assets", 10.0)
 
-            binary_asset = None
-            checksums_asset = None
-
-            for asset in release.assets:
-                if asset.name == expected_binary_name:
-                    binary_asset = asset
-                elif asset.name == "SHA256SUMS.txt":
-                    checksums_asset = asset
+            binary_asset = release.find_asset(expected_binary_name)
+            checksums_asset = release.find_asset("SHA256SUMS.txt")
 
             if binary_asset is None:
                 return UpdateResult(
@@ -219,46 +225,60 @@ class SelfUpdater:
             with tempfile.TemporaryDirectory() as tmpdir:
                 tmpdir_path = Path(tmpdir)
 
-                # Download SHA256SUMS.txt and binary in a single session
+                # Download SHA256SUMS.txt and binary in a single session.
+                # Both start together, so the checksum request's round trip
+                # is hidden behind the (much larger) binary transfer.
                 if progress_callback:
-                    progress_callback("Downloading checksums", 20.0)
-
-                async with self._github_client as client:
-                    checksums_text = await client.download_text(
-                        checksums_asset.download_url
-                    )
+                    progress_callback("Downloading release", 20.0)
 
-                    checksums = parse_sha256sums(checksums_text)
-                    expected_hash = checksums.get(binary_asset.name)
-
-                    if expected_hash is None:
-                        return UpdateResult(
-                            success=False,
-                            old_version=current_version,
-                            new_version=release.version,
-                            error_message=(
-                                f"No checksum found for '{binary_asset.name}' "
-                                "in SHA256SUMS.txt"
-                            ),
-                        )
+                new_binary_path = tmpdir_path / binary_asset.name
 
-                    # Download binary
+                def download_progress(percent: float, message: str) -> None:
+                    """Map download progress to 30-70% range."""
                     if progress_callback:
-                        progress_callback("Downloading binary", 30.0)
-
-                    new_binary_path = tmpdir_path / binary_asset.name
+                        mapped_percent = 30.0 + (percent * 0.4)
+                        progress_callback(f"Downloading: {message}", mapped_percent)
 
-                    def download_progress(percent: float, message: str) -> None:
-                        """Map download progress to 30-70% range."""
-                        if progress_callback:
-                            mapped_percent = 30.0 + (percent * 0.4)
-                            progress_callback(f"Downloading: {message}", mapped_percent)
+                # Hashed chunk by chunk as it downloads, so verifying needs
+                # no second pass over the file
+                hasher = hashlib.sha256()
 
-                    download_success = await client.download_asset(
-                        binary_asset.download_url,
-                        new_binary_path,
-                        download_progress,
+                async with self._github_client as client:
+                    download = asyncio.create_task(
+                        client.download_asset(
+                            binary_asset.download_url,
+                            new_binary_path,
+                            download_progress,
+                            hasher=hasher,
+                        )
                     )
+                    try:
+                        checksums_text = await client.download_text(
+                            checksums_asset.download_url
+                        )
+
+                        checksums = parse_sha256sums(checksums_text)
+                        expected_hash = checksums.get(binary_asset.name)
+
+                        if expected_hash is None:
+                            return UpdateResult(
+                                success=False,
+                                old_version=current_version,
+                                new_version=release.version,
+                                error_message=(
+                                    f"No checksum found for '{binary_asset.name}' "
+                                    "in SHA256SUMS.txt"
+                                ),
+                            )
+
+                        download_success = await download
+                    finally:
+                        # Without a usable checksum the binary is never
+                        # installed, so stop downloading it
+                        if not download.done():
+                            download.cancel()
+                            with contextlib.suppress(asyncio.CancelledError):
+                                await download
 
                 if not download_success:
                     return UpdateResult(
@@ -272,8 +292,8 @@ class SelfUpdater:
                 if progress_callback:
                     progress_callback("Verifying checksum", 75.0)
 
-                if not verify_checksum(new_binary_path, expected_hash):
-                    actual_hash = compute_sha256(new_binary_path)
+                actual_hash = hasher.hexdigest()
+                if actual_hash != expected_hash.lower():
                     return UpdateResult(
                         success=False,
                         old_version=current_version,
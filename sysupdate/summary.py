@@ -1,8 +1,9 @@
 """Update summary rendering for System Update Manager."""
 
 import re
+from operator import attrgetter
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.markup import escape
 from rich.table import Table
 from rich.text import Text
@@ -33,24 +34,32 @@ COUNT_BAR_WIDTH = 20
 # Maximum length of an inline failure message before truncation
 FAILURE_MSG_WIDTH = 60
 
+# Empty line between summary sections
+_BLANK = Text()
+
 # Neutral text tones used in the swept count line
 _TEXT_RGB = (226, 232, 240)
 _MUTED_RGB = (148, 163, 184)
 
+# Version-change arrow shown between the old and new version columns
+ARROW = "→"
+ASCII_ARROW = "->"
+
+# Package fields read per table row, fetched in one call per package
+_VERSION_FIELDS = attrgetter("name", "old_version", "new_version")
+_BRANCH_FIELDS = attrgetter("name", "new_version", "old_version")
+
 # Separators between version components, kept when tokenizing for diffs
 _VERSION_SEP = re.compile(r"([.\-+~:_])")
 
-# Table display configuration per manager label
-TABLE_CONFIG = {
-    "APT": {"title": "APT Packages", "name_col": "Package", "show_versions": True},
-    "Flatpak": {"title": "Flatpak Apps", "name_col": "App", "show_versions": False},
-    "Snap": {"title": "Snap Apps", "name_col": "App", "show_versions": True},
-    "DNF": {"title": "DNF Packages", "name_col": "Package", "show_versions": True},
-    "Pacman": {
-        "title": "Pacman Packages",
-        "name_col": "Package",
-        "show_versions": True,
-    },
+# Table display configuration per manager label:
+# (section title, name column header, show old/new versions)
+TABLE_CONFIG: dict[str, tuple[str, str, bool]] = {
+    "APT": ("APT Packages", "Package", True),
+    "Flatpak": ("Flatpak Apps", "App", False),
+    "Snap": ("Snap Apps", "App", True),
+    "DNF": ("DNF Packages", "Package", True),
+    "Pacman": ("Pacman Packages", "Package", True),
 }
 
 
@@ -116,34 +125,34 @@ def _print_count_line(
     sheen_sweep_line(console, segments, indent=3, animate=animate)
 
 
-def _print_count_bars(
-    console: Console, active: list[tuple[str, int]], use_ascii: bool
-) -> None:
-    """Print compact accent-colored count bars, one per manager."""
+def _count_bars(active: list[tuple[str, int]], use_ascii: bool) -> list[RenderableType]:
+    """Build compact accent-colored count bars, one per manager."""
     if len(active) < 2:
-        return
+        return []
     bar_char = "=" if use_ascii else "━"
     label_width = max(len(label) for label, _ in active)
     peak = max(count for _, count in active)
+    lines: list[RenderableType] = []
     for label, count in active:
         accent = MANAGER_ACCENTS.get(label, DEFAULT_ACCENT)
         cells = max(1, round(count / peak * COUNT_BAR_WIDTH))
-        console.print(
+        lines.append(
             f"   {label:<{label_width}}  [{accent}]{bar_char * cells}[/]"
             f" [dim]{count}[/]"
         )
-    console.print()
+    lines.append(_BLANK)
+    return lines
 
 
-def _print_failures(
-    console: Console,
+def _failure_lines(
     failures: list[tuple[str, str]],
     log_dir: str | None,
     use_ascii: bool,
-) -> None:
-    """Print failed updaters with a pointer to the log directory."""
+) -> list[RenderableType]:
+    """Build the failed-updater lines with a pointer to the log directory."""
     cross = "x" if use_ascii else "✗"
     sep = "|" if use_ascii else "·"
+    lines: list[RenderableType] = []
     for label, message in failures:
         msg = (message or "").strip()
         if len(msg) > FAILURE_MSG_WIDTH:
@@ -152,10 +161,11 @@ def _print_failures(
         line = f"   [bold {ERROR_STYLE}]{cross} {label} failed[/]"
         if msg:
             line += f" [dim]{sep} {escape(msg)}[/]"
-        console.print(line)
+        lines.append(line)
     if log_dir:
-        console.print(f"   [dim]Logs {sep} {escape(log_dir)}[/]")
-    console.print()
+        lines.append(f"   [dim]Logs {sep} {escape(log_dir)}[/]")
+    lines.append(_BLANK)
+    return lines
 
 
 def print_summary(
@@ -169,6 +179,10 @@ def print_summary(
 ) -> None:
     """Print the end-of-run summary of updated packages.
 
+    The summary is collected into a single Group and printed in one go
+    (the animated count line aside), so slow terminals see one flush
+    rather than one per line.
+
     Args:
         console: Rich Console instance for output.
         results_by_label: Dict mapping updater label to updated packages.
@@ -185,73 +199,76 @@ def print_summary(
     total = sum(len(pkgs) for pkgs in results_by_label.values())
     active = [(label, len(pkgs)) for label, pkgs in results_by_label.items() if pkgs]
 
-    console.print(gradient_rule(RULE_WIDTH, use_ascii))
-    console.print()
+    items: list[RenderableType] = [gradient_rule(RULE_WIDTH, use_ascii), _BLANK]
 
     if total == 0 and not failures:
-        console.print(
+        items.append(
             f"   [bold {SUCCESS_STYLE}]{check}[/] System is up to date"
             f" [dim]{dash} nothing to do[/]"
         )
         # Indented to align with the text column above (past the glyph)
-        _print_footer(console, elapsed, "Checked in", indent=5)
+        items.extend(_footer_lines(elapsed, "Checked in", indent=5))
+        console.print(Group(*items))
         return
 
     if total:
+        # The count line may animate, so it is printed on its own
+        console.print(Group(*items))
         _print_count_line(console, active, total, use_ascii, animate)
-        console.print()
-        _print_count_bars(console, active, use_ascii)
+        items = [_BLANK]
+        items.extend(_count_bars(active, use_ascii))
         for label, packages in results_by_label.items():
             if not packages:
                 continue
-            cfg = TABLE_CONFIG.get(
-                label, {"title": label, "name_col": "Package", "show_versions": True}
+            title, name_col, show_versions = TABLE_CONFIG.get(
+                label, (label, "Package", True)
             )
             accent = MANAGER_ACCENTS.get(label, DEFAULT_ACCENT)
             chip = "*" if use_ascii else "▪"
-            console.print(
-                f"   [{accent}]{chip}[/] [bold]{cfg['title']}[/]"
-                f" [dim]({len(packages)})[/]"
+            items.append(
+                f"   [{accent}]{chip}[/] [bold]{title}[/] [dim]({len(packages)})[/]"
             )
-            console.print()
-            print_package_table(
-                console,
-                packages,
-                cfg["name_col"],
-                cfg["show_versions"],
-                use_ascii,
-                accent,
+            items.append(_BLANK)
+            items.append(
+                build_package_table(
+                    packages,
+                    name_col,
+                    show_versions,
+                    use_ascii,
+                    accent,
+                )
             )
-            console.print()
+            items.append(_BLANK)
 
     if failures:
-        _print_failures(console, failures, log_dir, use_ascii)
+        items.extend(_failure_lines(failures, log_dir, use_ascii))
 
-    console.print(gradient_rule(RULE_WIDTH, use_ascii))
-    _print_footer(console, elapsed, "Done in")
+    items.append(gradient_rule(RULE_WIDTH, use_ascii))
+    items.extend(_footer_lines(elapsed, "Done in"))
+    console.print(Group(*items))
 
 
-def _print_footer(
-    console: Console, elapsed: float | None, verb: str, indent: int = 3
-) -> None:
-    """Print the optional timing tagline and closing blank line."""
+def _footer_lines(
+    elapsed: float | None, verb: str, indent: int = 3
+) -> list[RenderableType]:
+    """Build the optional timing tagline and closing blank line."""
+    lines: list[RenderableType] = []
     if elapsed is not None:
-        console.print(" " * indent + f"[dim]{verb} {format_elapsed(elapsed)}[/]")
-    console.print()
+        lines.append(" " * indent + f"[dim]{verb} {format_elapsed(elapsed)}[/]")
+    lines.append(_BLANK)
+    return lines
 
 
-def print_package_table(
-    console: Console,
+def build_package_table(
     packages: list[Package],
     name_col: str,
     show_versions: bool,
     use_ascii: bool,
     accent: str = DEFAULT_ACCENT,
-) -> None:
-    """Print a table of packages.
+) -> Table:
+    """Build a table of packages.
 
     Args:
-        console: Rich Console instance for output.
         packages: List of Package objects to display.
         name_col: Column header for package name.
         show_versions: Whether to show old/new version columns.
@@ -259,7 +276,7 @@ def print_package_table(
         accent: Accent color for the version-change arrow.
     """
     # ASCII fallback for arrow symbol
-    arrow = "->" if use_ascii else "→"
+    arrow = ASCII_ARROW if use_ascii else ARROW
 
     table = Table(
         show_header=True,
@@ -270,22 +287,24 @@ def print_package_table(
     )
     table.add_column(name_col, style="white")
 
+    # Rows are built up front in one pass, then fed to the table
+    rows: list[tuple[str | Text, ...]]
     if show_versions:
         table.add_column("Old", style="dim", justify="right")
         table.add_column("", style=accent, justify="center", width=3)
         table.add_column("New", style="white", justify="left")
-        for pkg in packages:
-            old_ver = pkg.old_version or "-"
-            table.add_row(
-                pkg.name,
-                old_ver,
-                arrow,
-                version_diff_text(pkg.old_version, pkg.new_version),
-            )
+        rows = [
+            (name, old or "-", arrow, version_diff_text(old, new))
+            for name, old, new in map(_VERSION_FIELDS, packages)
+        ]
     else:
         table.add_column("Branch", style="dim", justify="right")
-        for pkg in packages:
-            branch = pkg.new_version or pkg.old_version or "stable"
-            table.add_row(pkg.name, branch)
+        rows = [
+            (name, new or old or "stable")
+            for name, new, old in map(_BRANCH_FIELDS, packages)
+        ]
+
+    for row in rows:
+        table.add_row(*row)
 
-    console.print(table)
+    return table
@@ -1,7 +1,7 @@
 """Rich progress-display components for System Update Manager."""
 
 import math
-import re
+from functools import lru_cache
 from typing import cast
 
 from rich.progress import (
@@ -39,9 +39,6 @@ CHECKING_PROGRESS_END = 0.1
 # Progress bar width in characters
 BAR_WIDTH = 16
 
-# Precompiled pattern for stripping Rich markup tags
-_MARKUP_PATTERN = re.compile(r"\[[^\]]*\]")
-
 
 class StatusColumn(SpinnerColumn):
     """Status badge: animated spinner while checking, phase glyphs after."""
@@ -69,23 +66,49 @@ class StatusColumn(SpinnerColumn):
         super().__init__(**kwargs)
         self.use_ascii = use_ascii
 
-    def render(self, task: RichTask) -> Text:
-        styles = self.ASCII_PHASE_STYLES if self.use_ascii else self.PHASE_STYLES
+        # Badges are immutable, so build them once and share across renders
+        styles = self.ASCII_PHASE_STYLES if use_ascii else self.PHASE_STYLES
+        self._phase_texts = {
+            phase: Text(symbol, style=style)
+            for phase, (style, symbol) in styles.items()
+        }
+        self._default_text = Text("." if use_ascii else "\u25cf", style="white")
+        self._success_text = Text(
+            "+" if use_ascii else "\u2713", style=f"bold {SUCCESS_STYLE}"
+        )
+        self._failure_text = Text(
+            "x" if use_ascii else "\u2717", style=f"bold {ERROR_STYLE}"
+        )
 
+    def render(self, task: RichTask) -> Text:
         if task.finished:
             if task.fields.get("success", True):
-                symbol = "+" if self.use_ascii else "\u2713"
-                return Text(symbol, style=f"bold {SUCCESS_STYLE}")
-            symbol = "x" if self.use_ascii else "\u2717"
-            return Text(symbol, style=f"bold {ERROR_STYLE}")
+                return self._success_text
+            return self._failure_text
 
         phase = task.fields.get("phase", "checking")
         if phase == "checking":
             # Live spinner while probing for updates (a Text frame at runtime)
             return cast(Text, super().render(task))
-        default_symbol = "." if self.use_ascii else "\u25cf"
-        style, symbol = styles.get(phase, ("white", default_symbol))
-        return Text(symbol, style=style)
+        return self._phase_texts.get(phase, self._default_text)
+
+
+@lru_cache(maxsize=256)
+def _description_text(markup: str) -> Text:
+    """Parse a row description's markup (cached by string)."""
+    return Text.from_markup(markup, justify="left")
+
+
+class DescriptionColumn(ProgressColumn):
+    """Task description, rendered from markup.
+
+    Rich's TextColumn re-parses the markup of every row on every refresh.
+    Descriptions come from a small, fixed-width vocabulary, so each
+    distinct one is parsed once and the Text reused.
+    """
+
+    def render(self, task: RichTask) -> Text:
+        return _description_text(task.description)
 
 
 class GradientBarColumn(ProgressColumn):
@@ -126,10 +149,7 @@ class GradientBarColumn(ProgressColumn):
 
         filled = int(width * min(task.completed / task.total, 1.0)) if task.total else 0
         failed = task.finished and not task.fields.get("success", True)
-        for i in range(width):
-            if i >= filled:
-                bar.append(track_char, style="dim")
-                continue
+        for i in range(filled):
             rgb = gradient_rgb(i / span)
             if failed:
                 rgb = scale_rgb(blend_rgb(rgb, (248, 113, 113), 0.8), 0.85)
@@ -137,28 +157,35 @@ class GradientBarColumn(ProgressColumn):
                 # Glowing head cell on the advancing edge
                 rgb = blend_rgb(rgb, SHEEN_RGB, 0.6)
             bar.append(fill_char, style=f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}")
+        # The unfilled track is a single dim run rather than one span per cell
+        if filled < width:
+            bar.append(track_char * (width - filled), style="dim")
         return bar
 
 
 class PhaseAwareProgressColumn(TaskProgressColumn):
     """Task progress column that shows dim placeholder during indeterminate phase."""
 
+    # Matches the width of "100%" (4 chars)
+    PLACEHOLDER = Text("  - ", style="dim")
+
     def render(self, task: RichTask) -> Text:
         # When total is None (indeterminate), show placeholder to maintain width
         if task.total is None:
-            # Match width of "100%" (4 chars)
-            return Text("  - ", style="dim")
+            return self.PLACEHOLDER
         return super().render(task)
 
 
 class SpeedColumn(ProgressColumn):
     """Shows download speed when available."""
 
+    BLANK = Text(" " * 10, style="dim")
+
     def render(self, task: RichTask) -> Text:
         speed = task.fields.get("speed", "")
         if speed:
             return Text(f"{speed:>10}", style="cyan")
-        return Text(" " * 10, style="dim")
+        return self.BLANK
 
 
 class ETAColumn(ProgressColumn):
@@ -166,6 +193,7 @@ class ETAColumn(ProgressColumn):
 
     # Fixed width for ETA column (e.g., "ETA 10m30s" = 10 chars)
     ETA_WIDTH = 10
+    BLANK = Text(" " * ETA_WIDTH, style="dim")
 
     def render(self, task: RichTask) -> Text:
         eta = task.fields.get("eta", "")
@@ -177,4 +205,4 @@ class ETAColumn(ProgressColumn):
             elif len(text) > self.ETA_WIDTH:
                 text = text[: self.ETA_WIDTH]
             return Text(text, style="dim")
-        return Text(" " * self.ETA_WIDTH, style="dim")
+        return self.BLANK
@@ -1,11 +1,15 @@
 """Package manager update backends."""
 
-from .apt import AptUpdater
+from typing import TYPE_CHECKING
+
 from .base import BaseUpdater, Package, UpdateResult, UpdaterProtocol
-from .dnf import DnfUpdater
-from .flatpak import FlatpakUpdater
-from .pacman import PacmanUpdater
-from .snap import SnapUpdater
+
+if TYPE_CHECKING:
+    from .apt import AptUpdater
+    from .dnf import DnfUpdater
+    from .flatpak import FlatpakUpdater
+    from .pacman import PacmanUpdater
+    from .snap import SnapUpdater
 
 __all__ = [
     "BaseUpdater",
@@ -18,3 +22,24 @@ __all__ = [
     "DnfUpdater",
     "PacmanUpdater",
 ]
+
+# Backends are imported on first access, so modules that only need the
+# shared data structures from .base (the summary, the self-update path)
+# don't load every backend and its parsers.
+_BACKENDS = {
+    "AptUpdater": "sysupdate.updaters.apt",
+    "FlatpakUpdater": "sysupdate.updaters.flatpak",
+    "SnapUpdater": "sysupdate.updaters.snap",
+    "DnfUpdater": "sysupdate.updaters.dnf",
+    "PacmanUpdater": "sysupdate.updaters.pacman",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import backend classes."""
+    if name in _BACKENDS:
+        import importlib
+
+        module = importlib.import_module(_BACKENDS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,13 @@ import os
 import re
 from datetime import datetime
 
-from ..utils import command_available
+from ..utils import has_tool
 from ..utils.logging import UpdateLogger
 from ..utils.parsing import parse_apt_output
 from .apt_cache import is_apt_available
 from .apt_parallel import run_parallel_apt_update
 from .apt_parsing import AptUpdateProgressTracker, AptUpgradeProgressTracker
+from .aria2_downloader import Aria2Downloader
 from .base import (
     BaseUpdater,
     Package,
@@ -32,6 +33,8 @@ class AptUpdater(BaseUpdater):
     def __init__(self, use_parallel: bool = True) -> None:
         super().__init__()
         self._use_parallel = use_parallel
+        # One downloader serves both the availability probe and the download
+        self._downloader = Aria2Downloader()
 
     @property
     def name(self) -> str:
@@ -39,7 +42,7 @@ class AptUpdater(BaseUpdater):
 
     async def check_available(self) -> bool:
         """Check if APT is available."""
-        return await command_available("which", "apt")
+        return has_tool("apt")
 
     async def check_updates(self) -> list[Package]:
         """Check for available updates without installing."""
@@ -94,7 +97,7 @@ class AptUpdater(BaseUpdater):
         """Check if parallel downloads are available."""
         if not is_apt_available():
             return False
-        return await command_available("aria2c", "--version")
+        return await self._downloader.check_available()
 
     async def run_update(
         self,
@@ -212,6 +215,7 @@ class AptUpdater(BaseUpdater):
                 callback=callback,
                 dry_run=dry_run,
                 logger=self._logger,
+                downloader=self._downloader,
             )
         finally:
             if self._process:
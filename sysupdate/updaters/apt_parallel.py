@@ -28,6 +28,7 @@ async def run_parallel_apt_update(
     callback: ProgressCallback | None = None,
     dry_run: bool = False,
     logger: UpdateLogger | None = None,
+    downloader: Aria2Downloader | None = None,
 ) -> UpdateResult:
     """Run the APT update process using parallel downloads via aria2c.
 
@@ -38,6 +39,7 @@ async def run_parallel_apt_update(
         callback: Optional progress callback.
         dry_run: If True, don't actually install updates.
         logger: Optional logger instance.
+        downloader: Downloader to reuse; a new one is created if omitted.
 
     Returns:
         UpdateResult with success status and package list.
@@ -147,7 +149,8 @@ async def run_parallel_apt_update(
             )
         )
 
-        downloader = Aria2Downloader()
+        if downloader is None:
+            downloader = Aria2Downloader()
 
         def download_progress_callback(progress_info) -> None:
             """Callback for download progress from aria2."""
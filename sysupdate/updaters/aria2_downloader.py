@@ -35,12 +35,11 @@ class Aria2Downloader:
 
     METALINK_NAMESPACE = "urn:ietf:params:xml:ns:metalink"
 
-    def __init__(self) -> None:
-        """Initialize the downloader."""
-        self._progress_pattern = re.compile(
-            r"\[#[a-f0-9]+\s+(\d+)%.*?DL:([\d.]+[KMGT]?i?B/s).*?ETA:([\d]+[smh])\]"
-        )
-        self._complete_pattern = re.compile(r"Download complete: (.+)")
+    # aria2c console output patterns, compiled once for all instances
+    _progress_pattern = re.compile(
+        r"\[#[a-f0-9]+\s+(\d+)%.*?DL:([\d.]+[KMGT]?i?B/s).*?ETA:([\d]+[smh])\]"
+    )
+    _complete_pattern = re.compile(r"Download complete: (.+)")
 
     async def check_available(self) -> bool:
         """Check if aria2c is installed.
@@ -49,8 +48,11 @@ class Aria2Downloader:
             True if aria2c is available, False otherwise.
         """
         from ..utils import command_available
+        from ..utils.toolcache import get_or_probe
 
-        return await command_available("aria2c", "--version")
+        return await get_or_probe(
+            "aria2c", lambda: command_available("aria2c", "--version")
+        )
 
     async def download_packages(
         self,
@@ -3,7 +3,7 @@
 import asyncio
 import re
 
-from ..utils import command_available
+from ..utils import has_tool
 from .base import (
     BaseUpdater,
     Package,
@@ -24,7 +24,7 @@ class PacmanUpdater(BaseUpdater):
 
     async def check_available(self) -> bool:
         """Check if Pacman is available on the system."""
-        return await command_available("which", "pacman")
+        return has_tool("pacman")
 
     async def check_updates(self) -> list[Package]:
         """Check for available Pacman updates using pacman -Qu."""
@@ -32,7 +32,7 @@ class PacmanUpdater(BaseUpdater):
 
         try:
             # Use checkupdates if available (from pacman-contrib) as it doesn't need root
-            if await command_available("which", "checkupdates"):
+            if has_tool("checkupdates"):
                 proc = await asyncio.create_subprocess_exec(
                     "checkupdates",
                     stdout=asyncio.subprocess.PIPE,
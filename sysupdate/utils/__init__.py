@@ -1,7 +1,9 @@
 """Utility modules for parsing and logging."""
 
 import asyncio
+import shutil
 import time
+from functools import cache
 
 from .logging import get_log_path, setup_logging
 from .parsing import parse_apt_output, parse_flatpak_output
@@ -50,12 +52,33 @@ async def command_available(command: str, *args: str) -> bool:
     return result
 
 
+@cache
+def has_tool(name: str) -> bool:
+    """Check whether an executable is on PATH, without spawning a process.
+
+    Detection only needs a PATH lookup, so this uses ``shutil.which`` and
+    caches the answer for the life of the process. Use
+    :func:`command_available` when the tool has to actually run.
+
+    Args:
+        name: Executable name to look up.
+
+    Returns:
+        True if the executable resolves on PATH, False otherwise.
+    """
+    return shutil.which(name) is not None
+
+
 def invalidate_cache(command: str | None = None) -> None:
     """Invalidate command availability cache.
 
+    Also forgets every :func:`has_tool` lookup, so a freshly installed
+    tool is seen on the next check.
+
     Args:
         command: Specific command to invalidate. If None, clears entire cache.
     """
+    has_tool.cache_clear()
     if command is None:
         _availability_cache.clear()
     else:
@@ -70,5 +93,6 @@ __all__ = [
     "setup_logging",
     "get_log_path",
     "command_available",
+    "has_tool",
     "invalidate_cache",
 ]
@@ -3,9 +3,10 @@
 import asyncio
 import shutil
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.markup import escape
 from rich.prompt import Confirm
+from rich.text import Text
 
 from ..banner import (
     DEFAULT_ACCENT,
@@ -17,6 +18,23 @@ from ..banner import (
 )
 from . import invalidate_cache
 
+# Installer output is read in chunks of up to this many bytes; the
+# complete lines in each chunk are echoed with a single print
+INSTALL_OUTPUT_CHUNK = 16384
+
+# Pipe buffer for installer output. Generous enough that the transport
+# keeps reading (rather than pausing the pipe) while a batch is printed
+INSTALL_OUTPUT_LIMIT = 1024 * 1024
+
+_BLANK = Text()
+
+_SLOWER_NOTE = "  [dim]Continuing without aria2. Downloads will be slower![/]"
+
+
+def _print_block(console: Console, *lines: RenderableType) -> None:
+    """Print a message block, padded by blank lines, in one console write."""
+    console.print(Group(_BLANK, *lines, _BLANK))
+
 
 def _detect_install_command() -> list[str] | None:
     """Detect the system package manager and return the aria2 install command.
@@ -61,42 +79,61 @@ async def prompt_install_aria2(console: Console) -> bool:
 
     hint = _install_hint()
 
-    console.print()
-    console.print(gradient_rule(48, use_ascii, indent=2))
-    console.print()
-    console.print(
+    rule = gradient_rule(48, use_ascii, indent=2)
+    _print_block(
+        console,
+        rule,
+        _BLANK,
         f"  [bold {WARNING_STYLE}]{bolt} aria2c is not installed[/]"
-        f" [dim]{dash} downloads will be sequential[/]"
+        f" [dim]{dash} downloads will be sequential[/]",
+        _BLANK,
+        "  [dim]aria2 enables parallel package downloads,[/]",
+        "  [dim]significantly speeding up large updates.[/]",
+        _BLANK,
+        f"  Install manually [dim]{sep}[/] [bold]{hint}[/]",
+        _BLANK,
+        rule,
     )
-    console.print()
-    console.print("  [dim]aria2 enables parallel package downloads,[/]")
-    console.print("  [dim]significantly speeding up large updates.[/]")
-    console.print()
-    console.print(f"  Install manually [dim]{sep}[/] [bold]{hint}[/]")
-    console.print()
-    console.print(gradient_rule(48, use_ascii, indent=2))
-    console.print()
-
-    # Prompt user
-    loop = asyncio.get_running_loop()
-    install = await loop.run_in_executor(
-        None,
-        lambda: Confirm.ask(
-            f"  [bold {DEFAULT_ACCENT}]Install aria2 now?[/] [dim](takes a few seconds)[/]",
-            console=console,
-            default=True,
-        ),
+
+    # Prompt user; the blocking read runs in a worker thread
+    install = await asyncio.to_thread(
+        Confirm.ask,
+        f"  [bold {DEFAULT_ACCENT}]Install aria2 now?[/] [dim](takes a few seconds)[/]",
+        console=console,
+        default=True,
     )
 
     if not install:
-        console.print()
-        console.print("  [dim]Continuing without aria2. Downloads will be slower.[/]")
-        console.print()
+        _print_block(
+            console, "  [dim]Continuing without aria2. Downloads will be slower.[/]"
+        )
         return False
 
     return await _install_aria2(console)
 
 
+def _print_output(console: Console, data: bytes) -> None:
+    """Print a run of raw output lines, dimmed, in one call."""
+    lines = [
+        f"  [dim]{escape(stripped)}[/]"
+        for line in data.decode("utf-8", "replace").split("\n")
+        if (stripped := line.strip())
+    ]
+    if lines:
+        console.print("\n".join(lines))
+
+
+async def _echo_output(console: Console, stream: asyncio.StreamReader) -> None:
+    """Echo a subprocess's output, dimmed, one print per chunk read."""
+    pending = b""
+    while chunk := await stream.read(INSTALL_OUTPUT_CHUNK):
+        complete, newline, pending = (pending + chunk).rpartition(b"\n")
+        if newline:
+            _print_output(console, complete)
+    if pending:
+        _print_output(console, pending)
+
+
 async def _install_aria2(console: Console) -> bool:
     """Install aria2 using the detected system package manager.
 
@@ -108,54 +145,48 @@ async def _install_aria2(console: Console) -> bool:
     """
     cmd = _detect_install_command()
     if cmd is None:
-        console.print()
-        console.print("  [yellow]Could not detect a supported package manager.[/]")
-        console.print(
-            "  [dim]Please install aria2 manually using your package manager.[/]"
+        _print_block(
+            console,
+            "  [yellow]Could not detect a supported package manager.[/]",
+            "  [dim]Please install aria2 manually using your package manager.[/]",
         )
-        console.print()
         return False
 
-    console.print()
-    console.print(f"  [bold {INFO_STYLE}]Installing aria2…[/]")
-    console.print()
+    _print_block(console, f"  [bold {INFO_STYLE}]Installing aria2…[/]")
 
     try:
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
+            limit=INSTALL_OUTPUT_LIMIT,
         )
 
         if process.stdout:
-            async for line in process.stdout:
-                decoded = line.decode().strip()
-                if decoded:
-                    console.print(f"  [dim]{decoded}[/]")
+            await _echo_output(console, process.stdout)
 
         returncode = await process.wait()
 
         if returncode == 0:
             invalidate_cache("aria2c")
-            console.print()
-            console.print(f"  [bold {SUCCESS_STYLE}]✓ aria2 installed successfully![/]")
-            console.print("  [dim]Parallel downloads are now enabled.[/]")
-            console.print()
+            _print_block(
+                console,
+                f"  [bold {SUCCESS_STYLE}]✓ aria2 installed successfully![/]",
+                "  [dim]Parallel downloads are now enabled.[/]",
+            )
             return True
         else:
-            console.print()
-            console.print(f"  [bold {ERROR_STYLE}]✗ Failed to install aria2.[/]")
-            console.print(
-                "  [dim]Continuing without aria2. Downloads will be slower![/]"
+            _print_block(
+                console,
+                f"  [bold {ERROR_STYLE}]✗ Failed to install aria2.[/]",
+                _SLOWER_NOTE,
             )
-            console.print()
             return False
 
     except Exception as e:
-        console.print()
-        console.print(
-            f"  [bold {ERROR_STYLE}]✗ Installation error: {escape(str(e))}[/]"
+        _print_block(
+            console,
+            f"  [bold {ERROR_STYLE}]✗ Installation error: {escape(str(e))}[/]",
+            _SLOWER_NOTE,
         )
-        console.print("  [dim]Continuing without aria2. Downloads will be slower![/]")
-        console.print()
         return False
@@ -0,0 +1,53 @@
+"""JSON cache files under the user's cache directory.
+
+Shared by the tool-availability cache and the self-update release cache,
+so both live in the same directory and are written the same way.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def get_cache_dir() -> Path:
+    """Return sysupdate's cache directory (without creating it).
+
+    Uses XDG_CACHE_HOME/sysupdate, falling back to ~/.cache/sysupdate.
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", "")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "sysupdate"
+
+
+def load_json(path: Path) -> dict[str, Any]:
+    """Read the JSON object in *path*, tolerating missing/corrupt files.
+
+    Returns an empty dict if the file is missing, unreadable, not valid
+    JSON or does not hold an object.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json(path: Path, data: dict[str, Any]) -> None:
+    """Atomically write *data* to *path* as JSON.
+
+    The file is created readable and writable by the owner only. Failures
+    are ignored (caches are optional).
+    """
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(data))
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
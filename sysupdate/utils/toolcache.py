@@ -0,0 +1,112 @@
+"""Persistent cache for tool-availability probes.
+
+Probing a tool by running it (e.g. ``aria2c --version``) costs a
+subprocess spawn on every launch. The result only changes when the tool
+is installed, removed or upgraded, so it is cached on disk keyed by the
+modification time of the tool's binary and reused across runs until it
+expires.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from .cachefile import get_cache_dir, load_json, save_json
+
+# Cached probe results are trusted for up to an hour
+TOOL_CACHE_TTL_SECONDS = 3600
+
+# In-memory copy of the cache file, loaded on first use.
+# Maps tool name to {"mtime": float, "available": bool, "checked_at": float}.
+_tool_cache: dict[str, dict[str, float | bool]] | None = None
+
+
+def get_tool_cache_path() -> Path:
+    """Return the path of the tool cache file (without creating it).
+
+    Uses XDG_CACHE_HOME/sysupdate/tools.json, falling back to
+    ~/.cache/sysupdate/tools.json.
+    """
+    return get_cache_dir() / "tools.json"
+
+
+def _load() -> dict[str, dict[str, float | bool]]:
+    """Load the cache file once per process, tolerating missing/corrupt files."""
+    global _tool_cache
+    if _tool_cache is None:
+        data = load_json(get_tool_cache_path())
+        _tool_cache = {
+            name: entry for name, entry in data.items() if isinstance(entry, dict)
+        }
+    return _tool_cache
+
+
+def _is_valid_entry(entry: object) -> bool:
+    """Return True if *entry* has the shape written by get_or_probe."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("mtime"), (int, float))
+        and isinstance(entry.get("checked_at"), (int, float))
+        and isinstance(entry.get("available"), bool)
+    )
+
+
+def _save(cache: dict[str, dict[str, float | bool]]) -> None:
+    """Write the cache file. Failures are ignored (cache is optional)."""
+    save_json(get_tool_cache_path(), cache)
+
+
+def _binary_mtime(name: str) -> float | None:
+    """Return the mtime of the binary *name* resolves to on PATH, if any."""
+    path = shutil.which(name)
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+async def get_or_probe(name: str, probe: Callable[[], Awaitable[bool]]) -> bool:
+    """Return the cached availability of *name*, running *probe* on a miss.
+
+    A cached result is reused only while the binary's mtime is unchanged
+    and the entry is younger than ``TOOL_CACHE_TTL_SECONDS``. Tools that
+    do not resolve on PATH are always probed and never cached. Malformed
+    entries count as a miss and are overwritten.
+
+    Args:
+        name: Executable name used to locate the binary on PATH.
+        probe: Coroutine factory performing the real availability check.
+
+    Returns:
+        True if the tool is available, False otherwise.
+    """
+    mtime = _binary_mtime(name)
+    if mtime is None:
+        return await probe()
+
+    cache = _load()
+    entry = cache.get(name)
+    now = time.time()
+    if (
+        _is_valid_entry(entry)
+        and entry["mtime"] == mtime
+        and now - entry["checked_at"] < TOOL_CACHE_TTL_SECONDS
+    ):
+        return entry["available"]
+
+    available = await probe()
+    cache[name] = {"mtime": mtime, "available": available, "checked_at": now}
+    _save(cache)
+    return available
+
+
+def clear_tool_cache() -> None:
+    """Forget the in-memory cache so the next lookup re-reads the file."""
+    global _tool_cache
+    _tool_cache = None
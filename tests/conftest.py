@@ -6,12 +6,36 @@ import pytest
 @pytest.fixture(autouse=True)
 def clear_availability_cache():
     """Clear the command availability cache before each test."""
-    from sysupdate.utils import _availability_cache
+    from sysupdate.utils import _availability_cache, has_tool
     _availability_cache.clear()
+    has_tool.cache_clear()
     yield
     _availability_cache.clear()
+    has_tool.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_selfupdate_caches():
+    """Clear the memoized architecture and binary path before each test."""
+    from sysupdate.selfupdate.binary import get_architecture, get_binary_path
+
+    get_architecture.cache_clear()
+    get_binary_path.cache_clear()
+    yield
+    get_architecture.cache_clear()
+    get_binary_path.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_tool_cache(tmp_path, monkeypatch):
+    """Point the on-disk tool cache at a per-test directory."""
+    from sysupdate.utils.toolcache import clear_tool_cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    clear_tool_cache()
+    yield
+    clear_tool_cache()
+
 
 @pytest.fixture
 def apt_update_output():
@@ -1,11 +1,23 @@
 """Integration tests for the main application."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from io import StringIO
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from rich.console import Console
+from rich.progress import TaskID
+from rich.text import Text
 
 from sysupdate.app import SysUpdateCLI, UpdaterConfig
-from sysupdate.updaters.base import Package, UpdateResult
+from sysupdate.ui import DESC_WIDTH
+from sysupdate.updaters.base import Package, UpdatePhase, UpdateProgress, UpdateResult
+
+
+def render_summary(cli: SysUpdateCLI, results: dict) -> str:
+    """Render the CLI summary into a plain-text buffer and return it."""
+    cli.console = Console(file=StringIO(), width=100, color_system=None)
+    cli._print_summary(results)
+    return cli.console.file.getvalue()
 
 
 class TestSysUpdateCLI:
@@ -83,6 +95,22 @@ class TestSysUpdateCLI:
             assert "DNF" in labels
             assert "Pacman" in labels
 
+    def test_logging_deferred_until_first_use(self):
+        """Without --verbose, the main log is only set up when needed."""
+        with patch("sysupdate.app.setup_logging") as mock_setup:
+            cli = SysUpdateCLI()
+            mock_setup.assert_not_called()
+
+            assert cli._logger is mock_setup.return_value
+            assert cli._logger is mock_setup.return_value
+            mock_setup.assert_called_once_with(False)
+
+    def test_verbose_sets_up_logging_eagerly(self):
+        """--verbose configures the console handler up front."""
+        with patch("sysupdate.app.setup_logging") as mock_setup:
+            SysUpdateCLI(verbose=True)
+            mock_setup.assert_called_once_with(True)
+
 
 class TestCLIIntegration:
     """Integration tests for concurrent update execution."""
@@ -117,6 +145,32 @@ class TestCLIIntegration:
             # Should return success even if nothing to update
             assert result == 0
 
+    async def test_run_updates_probe_exception_means_unavailable(self):
+        """Test that a raising check_available is treated as not available."""
+        with (
+            patch("sysupdate.app.setup_logging"),
+            patch("sysupdate.app.Aria2Downloader") as mock_aria2,
+        ):
+            mock_aria2.return_value.check_available = AsyncMock(return_value=True)
+
+            cli = SysUpdateCLI()
+
+            for cfg in cli._updaters:
+                if cfg.label == "APT":
+                    cfg.updater.check_available = AsyncMock(
+                        side_effect=OSError("probe failed")
+                    )
+                    cfg.updater.run_update = AsyncMock()
+                else:
+                    cfg.updater.check_available = AsyncMock(return_value=False)
+
+            result = await cli._run_updates()
+
+            assert result == 0
+            self._get_updater_by_label(
+                cli, "APT"
+            ).updater.run_update.assert_not_called()
+
     async def test_run_updates_apt_only(self):
         """Test updates when only APT is available."""
         with (
@@ -285,24 +339,22 @@ class TestDryRunIndicator:
         with patch("sysupdate.app.setup_logging"):
             cli = SysUpdateCLI(dry_run=True)
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_header()
+            cli.console = Console(file=StringIO(), width=100, color_system=None)
+            cli._print_header()
 
-                # Check that DRY RUN indicator was printed
-                calls_str = str(mock_print.call_args_list)
-                assert "DRY RUN" in calls_str
+            # Check that DRY RUN indicator was printed
+            assert "DRY RUN" in cli.console.file.getvalue()
 
     def test_dry_run_indicator_not_shown_when_false(self):
         """Test that dry-run indicator is not shown in normal mode."""
         with patch("sysupdate.app.setup_logging"):
             cli = SysUpdateCLI(dry_run=False)
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_header()
+            cli.console = Console(file=StringIO(), width=100, color_system=None)
+            cli._print_header()
 
-                # Check that DRY RUN indicator was NOT printed
-                calls_str = str(mock_print.call_args_list)
-                assert "DRY RUN" not in calls_str
+            # Check that DRY RUN indicator was NOT printed
+            assert "DRY RUN" not in cli.console.file.getvalue()
 
 
 class TestASCIIFallback:
@@ -364,13 +416,10 @@ class TestASCIIFallback:
                 "Pacman": [],
             }
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_summary(results)
-
-                # ASCII mode should use '-' for line and '+' for checkmark
-                calls_str = str(mock_print.call_args_list)
-                # Should have ASCII arrow '->' for version changes
-                assert "->" in calls_str or "+" in calls_str
+            output = render_summary(cli, results)
+            # Should have ASCII arrow '->' for version changes
+            assert "->" in output
+            assert "→" not in output
 
 
 class TestExitCodes:
@@ -440,6 +489,23 @@ class TestExitCodes:
 
             assert result == 130
 
+    def test_run_uses_custom_loop_factory(self):
+        """An available loop factory (uvloop) drives the update run."""
+        factory = MagicMock(side_effect=asyncio.new_event_loop)
+
+        with (
+            patch("sysupdate.app.setup_logging"),
+            patch("sysupdate.app._event_loop_factory", return_value=factory),
+        ):
+            cli = SysUpdateCLI(no_animation=True)
+            cli._print_header = MagicMock()
+            cli._run_updates = AsyncMock(return_value=0)
+
+            assert cli.run() == 0
+
+        factory.assert_called_once()
+        cli._run_updates.assert_awaited_once()
+
 
 class TestPrintSummary:
     """Tests for summary output."""
@@ -451,12 +517,21 @@ class TestPrintSummary:
 
             results = {"APT": [], "Flatpak": [], "Snap": [], "DNF": [], "Pacman": []}
 
+            output = render_summary(cli, results)
+            # Should indicate system is up to date
+            assert "up to date" in output.lower()
+
+    def test_print_summary_is_a_single_write(self):
+        """The static summary is flushed to the console in one print."""
+        with patch("sysupdate.app.setup_logging"):
+            cli = SysUpdateCLI()
+
+            results = {"APT": [], "Flatpak": [], "Snap": [], "DNF": [], "Pacman": []}
+
             with patch.object(cli.console, "print") as mock_print:
                 cli._print_summary(results)
 
-                # Should indicate system is up to date
-                calls_str = str(mock_print.call_args_list)
-                assert "up to date" in calls_str.lower()
+            mock_print.assert_called_once()
 
     def test_print_summary_apt_only(self):
         """Test summary with APT packages only."""
@@ -475,14 +550,12 @@ class TestPrintSummary:
                 "Pacman": [],
             }
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_summary(results)
-
-                calls_str = str(mock_print.call_args_list)
-                assert "2" in calls_str  # 2 packages
-                assert "APT" in calls_str
-                # Check that a Table object was printed (for package details)
-                assert "Table object" in calls_str
+            output = render_summary(cli, results)
+            assert "2" in output  # 2 packages
+            assert "APT" in output
+            # Package details are rendered in the table
+            assert "pkg1" in output
+            assert "pkg2" in output
 
     def test_print_summary_flatpak_only(self):
         """Test summary with Flatpak packages only."""
@@ -501,12 +574,9 @@ class TestPrintSummary:
                 "Pacman": [],
             }
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_summary(results)
-
-                calls_str = str(mock_print.call_args_list)
-                assert "2" in calls_str  # 2 packages
-                assert "Flatpak" in calls_str
+            output = render_summary(cli, results)
+            assert "2" in output  # 2 packages
+            assert "Flatpak" in output
 
     def test_print_summary_both(self):
         """Test summary with both APT and Flatpak packages."""
@@ -523,13 +593,10 @@ class TestPrintSummary:
                 "Pacman": [],
             }
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_summary(results)
-
-                calls_str = str(mock_print.call_args_list)
-                assert "2" in calls_str  # Total 2 packages
-                assert "APT" in calls_str
-                assert "Flatpak" in calls_str
+            output = render_summary(cli, results)
+            assert "2" in output  # Total 2 packages
+            assert "APT" in output
+            assert "Flatpak" in output
 
     def test_print_summary_shows_all_packages(self):
         """Test that summary shows all packages without truncation."""
@@ -549,13 +616,10 @@ class TestPrintSummary:
                 "Pacman": [],
             }
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_summary(results)
-
-                calls_str = str(mock_print.call_args_list)
-                # Should NOT show "and X more" message - all packages displayed
-                assert "more" not in calls_str.lower()
-                assert "20" in calls_str  # Count shown in header
+            output = render_summary(cli, results)
+            # Should NOT show "and X more" message - all packages displayed
+            assert "more" not in output.lower()
+            assert "20" in output  # Count shown in header
 
     def test_print_summary_all_managers(self):
         """Test summary with packages from all managers."""
@@ -574,13 +638,267 @@ class TestPrintSummary:
                 ],
             }
 
-            with patch.object(cli.console, "print") as mock_print:
-                cli._print_summary(results)
+            output = render_summary(cli, results)
+            assert "5" in output  # Total 5 packages
+            assert "APT" in output
+            assert "Flatpak" in output
+            assert "Snap" in output
+            assert "DNF" in output
+            assert "Pacman" in output
 
-                calls_str = str(mock_print.call_args_list)
-                assert "5" in calls_str  # Total 5 packages
-                assert "APT" in calls_str
-                assert "Flatpak" in calls_str
-                assert "Snap" in calls_str
-                assert "DNF" in calls_str
-                assert "Pacman" in calls_str
+
+class TestProgressCallback:
+    """Tests for the per-updater progress callback."""
+
+    def _make_callback(self, max_pkg_len: int = 12):
+        with patch("sysupdate.app.setup_logging"):
+            cli = SysUpdateCLI()
+        progress = MagicMock()
+        callback = cli._create_progress_callback(
+            progress, TaskID(0), label="APT", max_pkg_len=max_pkg_len
+        )
+        return callback, progress
+
+    def test_checking_keeps_pulse_and_shows_message(self):
+        """Checking updates the description only, leaving total unset."""
+        callback, progress = self._make_callback()
+
+        callback(
+            UpdateProgress(phase=UpdatePhase.CHECKING, message="Refreshing lists...")
+        )
+
+        kwargs = progress.update.call_args.kwargs
+        assert "total" not in kwargs
+        assert kwargs["phase"] == "checking"
+        assert "Refreshing lists" in kwargs["description"]
+
+    def test_identical_ticks_are_skipped(self):
+        """Repeated progress with unchanged fields reaches Rich only once."""
+        callback, progress = self._make_callback()
+        update = UpdateProgress(
+            phase=UpdatePhase.DOWNLOADING, progress=0.5, current_package="curl"
+        )
+
+        callback(update)
+        callback(update)
+        callback(UpdateProgress(phase=UpdatePhase.CHECKING))
+        callback(UpdateProgress(phase=UpdatePhase.CHECKING))
+
+        assert progress.update.call_count == 2
+
+    def test_downloading_shows_truncated_package(self):
+        """Package names are cut to max_pkg_len in the description."""
+        callback, progress = self._make_callback(max_pkg_len=5)
+
+        callback(
+            UpdateProgress(
+                phase=UpdatePhase.DOWNLOADING,
+                progress=0.42,
+                current_package="libreoffice-core",
+            )
+        )
+
+        kwargs = progress.update.call_args.kwargs
+        assert kwargs["completed"] == 42
+        assert kwargs["total"] == 100
+        assert "libre" in kwargs["description"]
+        assert "libreo" not in kwargs["description"]
+
+    def test_complete_uses_plain_label(self):
+        """Terminal phases show just the label."""
+        callback, progress = self._make_callback()
+
+        callback(
+            UpdateProgress(
+                phase=UpdatePhase.COMPLETE, progress=1.0, current_package="ignored"
+            )
+        )
+
+        kwargs = progress.update.call_args.kwargs
+        assert kwargs["completed"] == 100
+        assert kwargs["phase"] == "complete"
+        assert "ignored" not in kwargs["description"]
+        assert "APT" in kwargs["description"]
+
+    def test_package_change_updates_description(self):
+        """Repeated packages reuse the description; a new one replaces it."""
+        callback, progress = self._make_callback()
+
+        descs = []
+        for pkg in ("curl", "curl", "wget"):
+            callback(
+                UpdateProgress(
+                    phase=UpdatePhase.INSTALLING, progress=0.5, current_package=pkg
+                )
+            )
+            descs.append(progress.update.call_args.kwargs["description"])
+
+        assert descs[0] is descs[1]
+        assert "curl" in descs[0]
+        assert "wget" in descs[2]
+
+
+class TestProgressPump:
+    """Tests for the queued progress consumer."""
+
+    async def test_backlog_collapses_to_latest(self):
+        """A burst of queued updates is drawn once, as the newest state."""
+        queue: asyncio.Queue = asyncio.Queue()
+        apply = MagicMock()
+        for i in range(5):
+            update = UpdateProgress(phase=UpdatePhase.DOWNLOADING, progress=i)
+            queue.put_nowait((apply, update))
+
+        pump = asyncio.create_task(SysUpdateCLI._pump_progress(queue))
+        await asyncio.sleep(0)
+        pump.cancel()
+
+        apply.assert_called_once()
+        assert apply.call_args.args[0].progress == 4
+
+    async def test_one_pump_serves_every_row(self):
+        """Interleaved updates from several updaters each draw their latest."""
+        queue: asyncio.Queue = asyncio.Queue()
+        apt, snap = MagicMock(), MagicMock()
+        for i in range(3):
+            queue.put_nowait((apt, UpdateProgress(progress=i)))
+            queue.put_nowait((snap, UpdateProgress(progress=10 + i)))
+
+        pump = asyncio.create_task(SysUpdateCLI._pump_progress(queue))
+        await asyncio.sleep(0)
+        pump.cancel()
+
+        assert apt.call_args.args[0].progress == 2
+        assert snap.call_args.args[0].progress == 12
+        assert apt.call_count == snap.call_count == 1
+
+    async def test_refresher_repaints_until_cancelled(self):
+        """The display is repainted from the loop at a fixed cadence."""
+        progress = MagicMock()
+
+        with patch("sysupdate.app.PROGRESS_REFRESH_INTERVAL", 0):
+            refresher = asyncio.create_task(SysUpdateCLI._refresh_progress(progress))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            refresher.cancel()
+
+        assert progress.refresh.call_count >= 2
+
+    async def test_run_updater_never_blocks_producer(self):
+        """Updaters can report faster than the display without blocking."""
+        with patch("sysupdate.app.setup_logging"):
+            cli = SysUpdateCLI()
+        cfg = cli._updaters[0]
+
+        async def fake_run_update(callback, dry_run):
+            for i in range(100):
+                callback(
+                    UpdateProgress(phase=UpdatePhase.DOWNLOADING, progress=i / 100)
+                )
+            return UpdateResult(success=True)
+
+        cfg.updater.run_update = fake_run_update
+        progress = MagicMock()
+
+        result = await cli._run_updater(progress, TaskID(0), cfg, asyncio.Queue())
+
+        assert result.success is True
+        final = progress.update.call_args.kwargs
+        assert final["completed"] == 100
+        assert final["success"] is True
+
+    async def test_stale_updates_do_not_overwrite_final_row(self):
+        """Updates still queued when an updater returns are discarded."""
+        with patch("sysupdate.app.setup_logging"):
+            cli = SysUpdateCLI()
+        cfg = cli._updaters[0]
+
+        async def fake_run_update(callback, dry_run):
+            callback(UpdateProgress(phase=UpdatePhase.DOWNLOADING, progress=0.5))
+            return UpdateResult(success=True)
+
+        cfg.updater.run_update = fake_run_update
+        progress = MagicMock()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        await cli._run_updater(progress, TaskID(0), cfg, queue)
+        pump = asyncio.create_task(SysUpdateCLI._pump_progress(queue))
+        await asyncio.sleep(0)
+        pump.cancel()
+
+        assert progress.update.call_count == 1
+        assert progress.update.call_args.kwargs["completed"] == 100
+
+    async def test_progress_from_worker_thread_reaches_queue(self):
+        """Updates reported off the loop thread are handed to the loop."""
+        with patch("sysupdate.app.setup_logging"):
+            cli = SysUpdateCLI()
+        cfg = cli._updaters[0]
+
+        async def fake_run_update(callback, dry_run):
+            update = UpdateProgress(phase=UpdatePhase.DOWNLOADING, progress=0.5)
+            await asyncio.to_thread(callback, update)
+            await asyncio.sleep(0)
+            return UpdateResult(success=True)
+
+        cfg.updater.run_update = fake_run_update
+        queue: asyncio.Queue = asyncio.Queue()
+
+        await cli._run_updater(MagicMock(), TaskID(0), cfg, queue)
+
+        _, update = queue.get_nowait()
+        assert update.progress == 0.5
+
+    async def test_no_queue_requests_no_progress(self):
+        """Without a live display the updater is not asked for progress."""
+        with patch("sysupdate.app.setup_logging"):
+            cli = SysUpdateCLI()
+        cfg = cli._updaters[0]
+        cfg.updater.run_update = AsyncMock(return_value=UpdateResult(success=True))
+        progress = MagicMock()
+
+        result = await cli._run_updater(progress, TaskID(0), cfg, None)
+
+        assert result.success is True
+        assert cfg.updater.run_update.await_args.kwargs["callback"] is None
+        assert progress.update.call_args.kwargs["completed"] == 100
+
+    async def test_run_updater_converts_exception_to_failed_result(self):
+        """An updater that raises yields a failed result and a failed row."""
+        with patch("sysupdate.app.setup_logging"):
+            cli = SysUpdateCLI()
+        cfg = cli._updaters[0]
+        cfg.updater.run_update = AsyncMock(side_effect=RuntimeError("boom"))
+        progress = MagicMock()
+
+        result = await cli._run_updater(progress, TaskID(0), cfg, asyncio.Queue())
+
+        assert result.success is False
+        assert result.error_message == "boom"
+        assert progress.update.call_args.kwargs["success"] is False
+
+
+class TestFormatDesc:
+    """Tests for fixed-width description formatting."""
+
+    def _make_cli(self) -> SysUpdateCLI:
+        with patch("sysupdate.app.setup_logging"):
+            return SysUpdateCLI()
+
+    def test_pads_to_visible_width(self):
+        """Markup does not count towards the padded width."""
+        desc = self._make_cli()._format_desc("", "[bold]APT[/]", "[dim]· idle[/]")
+        assert Text.from_markup(desc).cell_len == DESC_WIDTH
+
+    def test_wide_characters_measured_in_cells(self):
+        """Double-width glyphs are padded by cell width, not code points."""
+        desc = self._make_cli()._format_desc("", "[bold]APT[/]", "日本語")
+        assert Text.from_markup(desc).cell_len == DESC_WIDTH
+
+    def test_truncation_keeps_markup(self):
+        """Over-long descriptions are cut with an ellipsis, styles intact."""
+        desc = self._make_cli()._format_desc("", "[bold]APT[/]", "x" * 60)
+        text = Text.from_markup(desc)
+        assert text.cell_len == DESC_WIDTH
+        assert text.plain.endswith("…")
+        assert "[bold]" in desc
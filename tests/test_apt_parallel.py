@@ -381,3 +381,39 @@ class TestRunParallelAptUpdate:
         mock_logger.log.assert_called()
         logged_message = mock_logger.log.call_args[0][0]
         assert "falling back" in logged_message.lower()
+
+    async def test_reuses_provided_downloader(self):
+        """A downloader passed in is used instead of constructing a new one."""
+        run_apt_update = AsyncMock(return_value=True)
+        run_apt_install = AsyncMock(return_value=(True, ""))
+        run_sequential = AsyncMock()
+
+        package_infos = _make_package_infos(1)
+        mock_cache = MagicMock()
+        shared_downloader = MagicMock()
+        shared_downloader.download_packages = AsyncMock(
+            return_value=DownloadResult(success=True)
+        )
+
+        with (
+            patch(
+                "sysupdate.updaters.apt_parallel.AptCacheWrapper",
+                return_value=mock_cache,
+            ),
+            patch(
+                "asyncio.to_thread",
+                new_callable=AsyncMock,
+                return_value=package_infos,
+            ),
+            patch("sysupdate.updaters.apt_parallel.Aria2Downloader") as mock_cls,
+        ):
+            result = await run_parallel_apt_update(
+                run_apt_update=run_apt_update,
+                run_apt_install_from_cache=run_apt_install,
+                run_sequential_update=run_sequential,
+                downloader=shared_downloader,
+            )
+
+        assert result.success is True
+        mock_cls.assert_not_called()
+        shared_downloader.download_packages.assert_awaited_once()
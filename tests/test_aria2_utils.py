@@ -1,15 +1,27 @@
 """Tests for the aria2 installation helper utilities."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from sysupdate.utils.aria2 import (
+    INSTALL_OUTPUT_LIMIT,
     _detect_install_command,
+    _echo_output,
     _install_aria2,
     _install_hint,
     prompt_install_aria2,
 )
 
 
+def _stream(*chunks: bytes) -> asyncio.StreamReader:
+    """Build a finished stream that yields *chunks* as installer output."""
+    stream = asyncio.StreamReader()
+    for chunk in chunks:
+        stream.feed_data(chunk)
+    stream.feed_eof()
+    return stream
+
+
 class TestDetectInstallCommand:
     """Tests for _detect_install_command."""
 
@@ -95,31 +107,33 @@ class TestPromptInstallAria2:
         """Test that declining the prompt returns False without attempting install."""
         console = MagicMock()
 
-        with patch("asyncio.get_running_loop") as mock_loop_func:
-            mock_loop = MagicMock()
-            mock_loop_func.return_value = mock_loop
-            # run_in_executor returns a coroutine that yields False (user says no)
-            mock_loop.run_in_executor = AsyncMock(return_value=False)
-
+        with patch("sysupdate.utils.aria2.Confirm.ask", return_value=False):
             result = await prompt_install_aria2(console)
 
         assert result is False
 
+    async def test_warning_and_decline_are_one_print_each(self):
+        """The warning box and the decline note are each a single write."""
+        console = MagicMock()
+
+        with patch("sysupdate.utils.aria2.Confirm.ask", return_value=False):
+            await prompt_install_aria2(console)
+
+        assert console.print.call_count == 2
+
     async def test_user_accepts_installation_and_install_succeeds(self):
         """Test that accepting the prompt triggers installation."""
         console = MagicMock()
 
-        with patch("asyncio.get_running_loop") as mock_loop_func:
-            mock_loop = MagicMock()
-            mock_loop_func.return_value = mock_loop
-            mock_loop.run_in_executor = AsyncMock(return_value=True)
-
-            with patch(
+        with (
+            patch("sysupdate.utils.aria2.Confirm.ask", return_value=True),
+            patch(
                 "sysupdate.utils.aria2._install_aria2",
                 new_callable=AsyncMock,
                 return_value=True,
-            ) as mock_install:
-                result = await prompt_install_aria2(console)
+            ) as mock_install,
+        ):
+            result = await prompt_install_aria2(console)
 
         assert result is True
         mock_install.assert_awaited_once_with(console)
@@ -128,21 +142,62 @@ class TestPromptInstallAria2:
         """Test that a failed installation returns False."""
         console = MagicMock()
 
-        with patch("asyncio.get_running_loop") as mock_loop_func:
-            mock_loop = MagicMock()
-            mock_loop_func.return_value = mock_loop
-            mock_loop.run_in_executor = AsyncMock(return_value=True)
-
-            with patch(
+        with (
+            patch("sysupdate.utils.aria2.Confirm.ask", return_value=True),
+            patch(
                 "sysupdate.utils.aria2._install_aria2",
                 new_callable=AsyncMock,
                 return_value=False,
-            ):
-                result = await prompt_install_aria2(console)
+            ),
+        ):
+            result = await prompt_install_aria2(console)
 
         assert result is False
 
 
+class TestEchoOutput:
+    """Tests for chunked installer output."""
+
+    async def test_burst_is_printed_once(self):
+        """A burst of output read in one chunk costs a single print, in order."""
+        console = MagicMock()
+        stream = _stream(*(f"line {i}\n".encode() for i in range(20)))
+
+        await _echo_output(console, stream)
+
+        console.print.assert_called_once()
+        printed = console.print.call_args.args[0]
+        assert printed.count("\n") == 19
+        assert printed.index("line 0") < printed.index("line 19")
+
+    async def test_partial_lines_are_joined_across_reads(self):
+        """A line split between reads is printed whole, once complete."""
+        console = MagicMock()
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"Unpacking ar")
+
+        echo = asyncio.create_task(_echo_output(console, stream))
+        await asyncio.sleep(0)
+        console.print.assert_not_called()
+
+        stream.feed_data(b"ia2...\nSetting up")
+        await asyncio.sleep(0)
+        assert "Unpacking aria2..." in console.print.call_args.args[0]
+
+        stream.feed_eof()
+        await echo
+        assert "Setting up" in console.print.call_args.args[0]
+        assert console.print.call_count == 2
+
+    async def test_markup_and_invalid_bytes_are_safe(self):
+        """Output is escaped and undecodable bytes are replaced."""
+        console = MagicMock()
+
+        await _echo_output(console, _stream(b"[bold]x\xff\n\n"))
+
+        assert console.print.call_args.args[0] == "  [dim]\\[bold]x\ufffd[/]"
+
+
 class TestInstallAria2:
     """Tests for _install_aria2."""
 
@@ -162,11 +217,9 @@ class TestInstallAria2:
         mock_process = AsyncMock()
         mock_process.wait = AsyncMock(return_value=0)
 
-        async def mock_stdout_iter():
-            yield b"Reading package lists...\n"
-            yield b"Setting up aria2...\n"
-
-        mock_process.stdout = mock_stdout_iter()
+        mock_process.stdout = _stream(
+            b"Reading package lists...\n", b"Setting up aria2...\n"
+        )
 
         with patch(
             "sysupdate.utils.aria2._detect_install_command",
@@ -175,12 +228,13 @@ class TestInstallAria2:
             with patch(
                 "asyncio.create_subprocess_exec",
                 return_value=mock_process,
-            ):
+            ) as mock_exec:
                 with patch("sysupdate.utils.aria2.invalidate_cache") as mock_invalidate:
                     result = await _install_aria2(console)
 
         assert result is True
         mock_invalidate.assert_called_once_with("aria2c")
+        assert mock_exec.call_args.kwargs["limit"] == INSTALL_OUTPUT_LIMIT
 
     async def test_failed_installation_nonzero_exit(self):
         """Test that nonzero exit code from installer returns False."""
@@ -189,10 +243,7 @@ class TestInstallAria2:
         mock_process = AsyncMock()
         mock_process.wait = AsyncMock(return_value=1)
 
-        async def mock_stdout_iter():
-            yield b"E: Unable to locate package aria2\n"
-
-        mock_process.stdout = mock_stdout_iter()
+        mock_process.stdout = _stream(b"E: Unable to locate package aria2\n")
 
         with patch(
             "sysupdate.utils.aria2._detect_install_command",
@@ -229,11 +280,7 @@ class TestInstallAria2:
         mock_process = AsyncMock()
         mock_process.wait = AsyncMock(return_value=0)
 
-        async def mock_stdout_iter():
-            return
-            yield  # pragma: no cover
-
-        mock_process.stdout = mock_stdout_iter()
+        mock_process.stdout = _stream()
 
         with patch(
             "sysupdate.utils.aria2._detect_install_command",
@@ -255,11 +302,7 @@ class TestInstallAria2:
         mock_process = AsyncMock()
         mock_process.wait = AsyncMock(return_value=1)
 
-        async def mock_stdout_iter():
-            return
-            yield  # pragma: no cover
-
-        mock_process.stdout = mock_stdout_iter()
+        mock_process.stdout = _stream()
 
         with patch(
             "sysupdate.utils.aria2._detect_install_command",
@@ -2,6 +2,7 @@
 
 import re
 from io import StringIO
+from unittest.mock import patch
 
 from rich.console import Console
 
@@ -105,12 +106,34 @@ class TestBuildFrame:
         final = first_glyph_color(build_frame(rows))
         assert dark != final
 
+    def test_unrevealed_frame_merges_equal_style_runs(self):
+        rows = banner_rows(BLOCK_LOGO, "2.1.0", use_ascii=False)
+        frame = build_frame(rows, sweep=-100.0)
+        # Far before the band every glyph is near-black, so neighbours share
+        # styles and fewer spans than styled glyphs are needed
+        glyphs = sum(1 for ch in frame.plain if ch not in " \n")
+        assert len(frame.spans) < glyphs
+
+    def test_final_frame_is_copied_per_call(self):
+        rows = banner_rows(BLOCK_LOGO, "2.1.0", use_ascii=False)
+        first = build_frame(rows)
+        first.append("x")
+        assert build_frame(rows).plain != first.plain
+
     def test_gradient_rule_width_and_style(self):
         rule = gradient_rule(40, use_ascii=False, indent=3)
         assert rule.plain == " " * 3 + "─" * 40
         rule_ascii = gradient_rule(40, use_ascii=True, indent=3)
         assert rule_ascii.plain == " " * 3 + "-" * 40
 
+    def test_gradient_rule_returns_independent_copies(self):
+        first = gradient_rule(40, use_ascii=False)
+        second = gradient_rule(40, use_ascii=False)
+        assert first is not second
+        assert first.spans == second.spans
+        first.append("x")
+        assert second.plain == " " * 3 + "─" * 40
+
 
 class TestLogoSelection:
     """Adaptive art selection by terminal capability and width."""
@@ -140,6 +163,12 @@ class TestShowBanner:
         show_banner(console, "2.1.0", dry_run=True, use_ascii=False)
         assert "DRY RUN" in console_text(console)
 
+    def test_static_path_prints_once(self):
+        console = make_console()
+        with patch.object(console, "print", wraps=console.print) as print_:
+            show_banner(console, "2.1.0", dry_run=True, use_ascii=False)
+        print_.assert_called_once()
+
     def test_ascii_mode_avoids_unicode_blocks(self):
         console = make_console()
         show_banner(console, "2.1.0", dry_run=False, use_ascii=True)
@@ -19,12 +19,7 @@ class TestDnfUpdater:
 
     async def test_check_available_dnf5_preferred(self, updater):
         """Test that dnf5 is preferred when both dnf and dnf5 exist."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 0
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", side_effect=lambda n: f"/usr/bin/{n}"):
             result = await updater.check_available()
 
             assert result is True
@@ -33,17 +28,10 @@ class TestDnfUpdater:
 
     async def test_check_available_dnf4_fallback(self, updater):
         """Test fallback to dnf when dnf5 doesn't exist."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_dnf5_proc = AsyncMock()
-            mock_dnf5_proc.returncode = 1
-            mock_dnf5_proc.wait = AsyncMock()
-
-            mock_dnf_proc = AsyncMock()
-            mock_dnf_proc.returncode = 0
-            mock_dnf_proc.wait = AsyncMock()
-
-            mock_exec.side_effect = [mock_dnf5_proc, mock_dnf_proc]
-
+        with patch(
+            "sysupdate.utils.shutil.which",
+            side_effect=lambda n: "/usr/bin/dnf" if n == "dnf" else None,
+        ):
             result = await updater.check_available()
 
             assert result is True
@@ -52,25 +40,22 @@ class TestDnfUpdater:
 
     async def test_check_available_none(self, updater):
         """Test returns False when neither dnf5 nor dnf exists."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 1
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value=None):
             result = await updater.check_available()
 
             assert result is False
 
 
-    async def test_check_available_exception(self, updater):
-        """Test check_available handles exceptions gracefully."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_exec.side_effect = Exception("Command not found")
-
+    async def test_check_available_spawns_no_process(self, updater):
+        """Test check_available is a PATH lookup, not a subprocess."""
+        with (
+            patch("asyncio.create_subprocess_exec") as mock_exec,
+            patch("sysupdate.utils.shutil.which", return_value=None),
+        ):
             result = await updater.check_available()
 
             assert result is False
+            mock_exec.assert_not_called()
 
 
     async def test_check_updates_parses_output(self, updater, dnf_check_update_output):
@@ -15,11 +15,34 @@ class TestCheckSudo:
     @patch("sysupdate.__main__.subprocess.run")
     def test_returns_true_on_success(self, mock_run):
         """check_sudo returns True when sudo -v exits with 0."""
+        mock_run.side_effect = [
+            subprocess.CompletedProcess(args=["sudo", "-n", "-v"], returncode=1),
+            subprocess.CompletedProcess(args=["sudo", "-v"], returncode=0),
+        ]
+        assert check_sudo() is True
+        assert mock_run.call_count == 2
+        mock_run.assert_called_with(["sudo", "-v"], check=False)
+
+    @patch("sysupdate.__main__.subprocess.run")
+    def test_cached_credentials_skip_prompt(self, mock_run):
+        """check_sudo returns early when sudo -n -v succeeds."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["sudo", "-v"], returncode=0
+            args=["sudo", "-n", "-v"], returncode=0
         )
         assert check_sudo() is True
-        mock_run.assert_called_once_with(["sudo", "-v"], check=False)
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["sudo", "-n", "-v"]
+        assert "timeout" in mock_run.call_args.kwargs
+
+    @patch("sysupdate.__main__.subprocess.run")
+    def test_prompts_when_cached_check_times_out(self, mock_run):
+        """A hung non-interactive check falls back to the interactive prompt."""
+        mock_run.side_effect = [
+            subprocess.TimeoutExpired(cmd=["sudo", "-n", "-v"], timeout=10),
+            subprocess.CompletedProcess(args=["sudo", "-v"], returncode=0),
+        ]
+        assert check_sudo() is True
+        mock_run.assert_called_with(["sudo", "-v"], check=False)
 
     @patch("sysupdate.__main__.subprocess.run")
     def test_returns_false_on_nonzero_exit(self, mock_run):
@@ -43,10 +66,22 @@ class TestCheckSudo:
         mock_run.side_effect = OSError("No such file or directory: 'sudo'")
         assert check_sudo() is False
 
+    @patch("sysupdate.__main__.subprocess.run")
+    def test_credential_check_timeout_prompts(self, mock_run):
+        """A hung non-interactive check falls through to the prompt."""
+        mock_run.side_effect = [
+            subprocess.TimeoutExpired(["sudo", "-n", "-v"], 10),
+            subprocess.CompletedProcess(args=["sudo", "-v"], returncode=0),
+        ]
+        assert check_sudo() is True
+
     @patch("sysupdate.__main__.subprocess.run")
     def test_returns_false_on_generic_exception(self, mock_run):
         """check_sudo returns False on any unexpected exception."""
-        mock_run.side_effect = RuntimeError("unexpected error")
+        mock_run.side_effect = [
+            subprocess.CompletedProcess(args=["sudo", "-n", "-v"], returncode=1),
+            RuntimeError("unexpected error"),
+        ]
         assert check_sudo() is False
 
 
@@ -288,3 +323,40 @@ class TestMain:
             result = main()
 
         assert result == 1
+
+    def test_help_lists_self_update(self, capsys):
+        """--help still documents the self-update subcommand."""
+        with (
+            patch("sys.argv", ["sysupdate", "--help"]),
+            pytest.raises(SystemExit),
+        ):
+            main()
+
+        assert "self-update" in capsys.readouterr().out
+
+    def test_abbreviated_help_lists_self_update(self, capsys):
+        """An abbreviated --help still documents the self-update subcommand."""
+        with (
+            patch("sys.argv", ["sysupdate", "--he"]),
+            pytest.raises(SystemExit),
+        ):
+            main()
+
+        assert "self-update" in capsys.readouterr().out
+
+    def test_clustered_help_lists_self_update(self, capsys):
+        """A -h inside a short-flag cluster also documents self-update."""
+        with (
+            patch("sys.argv", ["sysupdate", "-vh"]),
+            pytest.raises(SystemExit),
+        ):
+            main()
+
+        assert "self-update" in capsys.readouterr().out
+
+    def test_unknown_command_rejected(self):
+        """An unknown positional is still rejected by argparse."""
+        with patch("sys.argv", ["sysupdate", "bogus"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+            assert exc_info.value.code == 2
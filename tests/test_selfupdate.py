@@ -13,11 +13,7 @@ from sysupdate.selfupdate.binary import (
     get_expected_asset_name,
     replace_binary,
 )
-from sysupdate.selfupdate.checksum import (
-    compute_sha256,
-    parse_sha256sums,
-    verify_checksum,
-)
+from sysupdate.selfupdate.checksum import parse_sha256sums
 from sysupdate.selfupdate.github import GitHubClient, Release, ReleaseAsset
 
 
@@ -59,71 +55,18 @@ abc123def456  sysupdate-linux-x86_64
 
         assert checksums["testfile.bin"] == "abc123def456"
 
+    def test_parse_sha256sums_binary_mode(self):
+        """Test that the '*' binary-mode marker is not part of the filename."""
+        content = "abc123 *sysupdate-linux-x86_64\ndef456  plain.bin\n"
+        checksums = parse_sha256sums(content)
+
+        assert checksums == {"sysupdate-linux-x86_64": "abc123", "plain.bin": "def456"}
+
     def test_parse_sha256sums_empty(self):
         """Test parsing empty content returns empty dict."""
         checksums = parse_sha256sums("")
         assert checksums == {}
 
-    def test_compute_sha256(self, tmp_path):
-        """Test computing SHA256 hash of a file."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Hello, World!")
-
-        # SHA256 of "Hello, World!" is known
-        expected = "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
-        actual = compute_sha256(test_file)
-
-        assert actual == expected
-
-    def test_compute_sha256_large_file(self, tmp_path):
-        """Test computing SHA256 of large file using chunked reading."""
-        test_file = tmp_path / "large.bin"
-
-        # Create a file larger than the chunk size (8192 bytes)
-        data = b"x" * 10000
-        test_file.write_bytes(data)
-
-        hash_value = compute_sha256(test_file)
-
-        # Verify hash is 64 hex characters
-        assert len(hash_value) == 64
-        assert all(c in "0123456789abcdef" for c in hash_value)
-
-    def test_compute_sha256_nonexistent_file(self, tmp_path):
-        """Test computing SHA256 of nonexistent file raises FileNotFoundError."""
-        nonexistent = tmp_path / "does_not_exist.txt"
-
-        with pytest.raises(FileNotFoundError):
-            compute_sha256(nonexistent)
-
-    def test_verify_checksum_success(self, tmp_path):
-        """Test verify_checksum with correct hash matches."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Hello, World!")
-
-        expected_hash = "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
-
-        assert verify_checksum(test_file, expected_hash) is True
-
-    def test_verify_checksum_failure(self, tmp_path):
-        """Test verify_checksum with wrong hash fails."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Hello, World!")
-
-        wrong_hash = "0000000000000000000000000000000000000000000000000000000000000000"
-
-        assert verify_checksum(test_file, wrong_hash) is False
-
-    def test_verify_checksum_case_insensitive(self, tmp_path):
-        """Test verify_checksum is case-insensitive."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Hello, World!")
-
-        # Uppercase hash should still match
-        uppercase_hash = "DFFD6021BB2BD5B0AF676290809EC3A53191DD81C7F70A4B28688A362182986F"
-
-        assert verify_checksum(test_file, uppercase_hash) is True
-
 
 class TestBinaryPathDetection:
     """Tests for binary path detection in various scenarios."""
@@ -178,13 +121,10 @@ class TestBinaryPathDetection:
         mock_binary.write_bytes(b"mock binary")
 
         with patch("os.getppid", return_value=12345):
-            with patch.object(
-                Path,
-                "resolve",
-                return_value=mock_binary,
-            ):
+            with patch("os.readlink", return_value=str(mock_binary)) as readlink:
                 result = get_binary_path()
                 assert result == mock_binary
+            readlink.assert_called_once_with("/proc/12345/exe")
 
     def test_get_binary_path_from_sys_executable(self, tmp_path):
         """Test get_binary_path falls back to sys.executable."""
@@ -194,7 +134,7 @@ class TestBinaryPathDetection:
         mock_binary.write_bytes(b"mock binary")
 
         with patch("os.getppid", return_value=1):
-            with patch.object(Path, "resolve", side_effect=OSError("No such file")):
+            with patch("os.readlink", side_effect=OSError("No such file")):
                 with patch("sys.executable", str(mock_binary)):
                     result = get_binary_path()
                     assert result == mock_binary
@@ -222,7 +162,7 @@ class TestBinaryPathDetection:
 
         with patch.dict(os.environ, {"PYAPP": ""}):
             with patch("os.getppid", return_value=1):
-                with patch("pathlib.Path.resolve", side_effect=OSError("No such file")):
+                with patch("os.readlink", side_effect=OSError("No such file")):
                     with patch("sys.executable", "/usr/bin/python3"):
                         with patch("shutil.which", return_value=None):
                             with pytest.raises(RuntimeError) as exc_info:
@@ -258,6 +198,7 @@ class TestBinary:
         with patch("platform.machine", return_value="X86_64"):
             assert get_architecture() == "x86_64"
 
+        get_architecture.cache_clear()
         with patch("platform.machine", return_value="AARCH64"):
             assert get_architecture() == "aarch64"
 
@@ -270,6 +211,14 @@ class TestBinary:
             assert "Unsupported architecture: mips" in str(exc_info.value)
             assert "x86_64, aarch64" in str(exc_info.value)
 
+    def test_get_architecture_is_cached(self):
+        """Test get_architecture queries the platform only once."""
+        with patch("platform.machine", return_value="x86_64") as mock_machine:
+            assert get_architecture() == "x86_64"
+            assert get_architecture() == "x86_64"
+
+        mock_machine.assert_called_once()
+
     def test_get_expected_asset_name_x86_64(self):
         """Test get_expected_asset_name for x86_64."""
         assert get_expected_asset_name("x86_64") == "sysupdate-linux-x86_64"
@@ -322,6 +271,16 @@ class TestGitHubClient:
         assert len(release.assets) == 2
         assert release.prerelease is False
 
+    def test_release_find_asset(self):
+        """Test Release.find_asset looks assets up by name."""
+        binary = ReleaseAsset("sysupdate-linux-x86_64", "https://example.com/b", 1)
+        sums = ReleaseAsset("SHA256SUMS.txt", "https://example.com/s", 2)
+        release = Release("v1.0.0", "1.0.0", "", [binary, sums], False)
+
+        assert release.find_asset("SHA256SUMS.txt") is sums
+        assert release.find_asset("sysupdate-linux-x86_64") is binary
+        assert release.find_asset("sysupdate-linux-riscv64") is None
+
 
     async def test_github_client_context_manager(self):
         """Test GitHubClient works as async context manager."""
@@ -331,6 +290,43 @@ class TestGitHubClient:
         # Session should be closed after exit
         assert client._session is None
 
+    async def test_github_client_nested_entries_share_session(self):
+        """Nested entries reuse the outer session; only the outermost closes it."""
+        client = GitHubClient(timeout=30.0)
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session_class.return_value.close = AsyncMock()
+            async with client:
+                async with client:
+                    pass
+                mock_session_class.return_value.close.assert_not_awaited()
+                assert client._session is mock_session_class.return_value
+
+        mock_session_class.assert_called_once()
+        mock_session_class.return_value.close.assert_awaited_once()
+        assert client._session is None
+
+    async def test_github_client_identifies_itself(self):
+        """The session sends a sysupdate User-Agent; API calls pin the media type."""
+        from sysupdate import __version__
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(
+                return_value=self._make_json_response(
+                    {"tag_name": "v1.0.0", "assets": []}
+                )
+            )
+            mock_session.close = AsyncMock()
+
+            async with GitHubClient() as client:
+                await client.get_latest_release()
+
+        session_headers = mock_session_class.call_args.kwargs["headers"]
+        assert session_headers["User-Agent"] == f"sysupdate/{__version__}"
+        request_headers = mock_session.get.call_args.kwargs["headers"]
+        assert request_headers["Accept"] == "application/vnd.github+json"
+
     @staticmethod
     def _make_json_response(data: dict, status: int = 200) -> AsyncMock:
         """Create a mock response that serves JSON via content.read()."""
@@ -419,6 +415,144 @@ class TestGitHubClient:
             assert release.assets[0].name == "sysupdate-linux-x86_64"
 
 
+    async def test_get_latest_release_revalidates_with_etag(self):
+        """A cached release is revalidated with If-None-Match and reused on 304."""
+        import stat
+
+        from sysupdate.selfupdate.github import get_release_cache_path
+
+        download_url = (
+            "https://github.com/cosmix/sysupdate/releases/download/v2.0.1/"
+            "sysupdate-linux-x86_64"
+        )
+        data = {
+            "tag_name": "v2.0.1",
+            "name": "Release 2.0.1",
+            "prerelease": False,
+            "assets": [
+                {
+                    "name": "sysupdate-linux-x86_64",
+                    "browser_download_url": download_url,
+                    "size": 1024,
+                },
+            ],
+        }
+        first = self._make_json_response(data)
+        first.headers["ETag"] = '"abc"'
+        not_modified = AsyncMock(status=304, headers={}, release=AsyncMock())
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(side_effect=[first, not_modified])
+            mock_session.close = AsyncMock()
+
+            async with GitHubClient() as client:
+                fresh = await client.get_latest_release()
+                cached = await client.get_latest_release()
+
+        assert cached == fresh
+        assert cached.assets[0].download_url == download_url
+        assert stat.S_IMODE(get_release_cache_path().stat().st_mode) == 0o600
+        first_call, second_call = mock_session.get.call_args_list
+        assert "If-None-Match" not in first_call.kwargs["headers"]
+        assert second_call.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    async def test_get_latest_release_ignores_cache_with_foreign_urls(self):
+        """A tampered cache entry pointing assets elsewhere is not trusted."""
+        data = {
+            "tag_name": "v2.0.1",
+            "name": "Release 2.0.1",
+            "prerelease": False,
+            "assets": [
+                {
+                    "name": "sysupdate-linux-x86_64",
+                    "browser_download_url": "https://example.com/x86_64",
+                    "size": 1024,
+                },
+            ],
+        }
+        first = self._make_json_response(data)
+        first.headers["ETag"] = '"abc"'
+        second = self._make_json_response(data)
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(side_effect=[first, second])
+            mock_session.close = AsyncMock()
+
+            async with GitHubClient() as client:
+                await client.get_latest_release()
+                await client.get_latest_release()
+
+        second_call = mock_session.get.call_args_list[1]
+        assert "If-None-Match" not in second_call.kwargs["headers"]
+
+    async def test_get_latest_release_skips_request_while_rate_limited(self):
+        """An exhausted rate limit is remembered until its reset time."""
+        import time
+
+        limited = AsyncMock(status=403, release=AsyncMock())
+        limited.headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(return_value=limited)
+            mock_session.close = AsyncMock()
+
+            async with GitHubClient() as client:
+                assert await client.get_latest_release() is None
+                assert await client.get_latest_release() is None
+
+        mock_session.get.assert_awaited_once()
+
+    async def _latest_release_with_body(self, body: bytes):
+        """Run get_latest_release against a 200 response serving *body*."""
+        response = self._make_json_response({})
+        response.headers = {"content-length": str(len(body))}
+        response.content.read = AsyncMock(return_value=body)
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(return_value=response)
+            mock_session.close = AsyncMock()
+
+            async with GitHubClient() as client:
+                return await client.get_latest_release()
+
+    async def test_get_latest_release_malformed_body_with_orjson(self):
+        """orjson's decode error is caught like the stdlib one."""
+        orjson = pytest.importorskip("orjson")
+        from sysupdate.selfupdate import github
+
+        def loads(body):
+            raise orjson.JSONDecodeError("bad", "", 0)
+
+        with patch.object(github, "_json_loads", loads):
+            assert await self._latest_release_with_body(b"{not json") is None
+
+    async def test_get_latest_release_stdlib_json_fallback(self):
+        """Without orjson the stdlib parser handles good and bad bodies."""
+        import json
+
+        from sysupdate.selfupdate import github
+
+        body = json.dumps(
+            {"tag_name": "v2.0.1", "name": "", "prerelease": False, "assets": []}
+        ).encode()
+
+        with patch.object(github, "_json_loads", json.loads):
+            assert await self._latest_release_with_body(b"{not json") is None
+            release = await self._latest_release_with_body(body)
+
+        assert release.version == "2.0.1"
+
     async def test_get_latest_release_strips_v_prefix(self):
         """Test get_latest_release strips 'v' prefix from version."""
         mock_response_data = {
@@ -451,6 +585,7 @@ class TestGitHubClient:
 
             mock_response = AsyncMock()
             mock_response.status = 404
+            mock_response.headers = {}
             mock_response.release = AsyncMock()
             mock_response.request_info = MagicMock()
             mock_session.get = AsyncMock(return_value=mock_response)
@@ -543,6 +678,193 @@ class TestGitHubClient:
             assert len(progress_calls) > 0
             assert progress_calls[-1][0] == 100.0
 
+    async def test_download_asset_feeds_hasher(self, tmp_path):
+        """Test download_asset hashes the bytes it writes."""
+        import hashlib
+
+        dest_file = tmp_path / "binary"
+        file_content = b"binary content here"
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(
+                return_value=self._make_binary_response(file_content)
+            )
+            mock_session.close = AsyncMock()
+
+            hasher = hashlib.sha256()
+            async with GitHubClient() as client:
+                success = await client.download_asset(
+                    "https://example.com/file", dest_file, hasher=hasher
+                )
+
+        assert success is True
+        assert hasher.hexdigest() == hashlib.sha256(file_content).hexdigest()
+
+    async def test_download_asset_writes_in_batches(self, tmp_path):
+        """Test download_asset writes whole batches off the event loop."""
+        from sysupdate.selfupdate import github
+
+        dest_file = tmp_path / "binary"
+        file_content = bytes(range(256)) * 4096  # 1 MiB
+        response = self._make_binary_response(file_content)
+
+        async def iter_chunked(size):
+            for start in range(0, len(file_content), size):
+                yield file_content[start : start + size]
+
+        response.content.iter_chunked = iter_chunked
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(return_value=response)
+            mock_session.close = AsyncMock()
+
+            with patch.object(
+                github, "_write_batch", wraps=github._write_batch
+            ) as write_batch:
+                async with GitHubClient() as client:
+                    success = await client.download_asset(
+                        "https://example.com/file", dest_file
+                    )
+
+        assert success is True
+        assert dest_file.read_bytes() == file_content
+        expected = -(-len(file_content) // github.DOWNLOAD_WRITE_BATCH_BYTES)
+        assert write_batch.call_count == expected
+
+    async def test_download_asset_reports_progress_per_percent(self, tmp_path):
+        """Test many small chunks produce at most one progress call per percent."""
+        file_content = b"x" * 100_000
+        response = self._make_binary_response(file_content)
+
+        async def iter_chunked(size):
+            for start in range(0, len(file_content), 100):
+                yield file_content[start : start + 100]
+
+        response.content.iter_chunked = iter_chunked
+        progress_calls = []
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = AsyncMock(return_value=response)
+            mock_session.close = AsyncMock()
+
+            async with GitHubClient() as client:
+                await client.download_asset(
+                    "https://example.com/file",
+                    tmp_path / "binary",
+                    lambda percent, message: progress_calls.append(percent),
+                )
+
+        # 1000 chunks, but one call per whole percent (0-100) plus the
+        # final "Download complete"
+        assert len(progress_calls) == 102
+        assert progress_calls[-1] == 100.0
+
+    def _make_ranged_get(self, content: bytes, range_status: int = 206):
+        """Create a session.get that serves *content* and honours Range headers."""
+
+        def serve(body: bytes, status: int, headers: dict) -> AsyncMock:
+            response = self._make_binary_response(body, status)
+            response.headers = headers
+
+            async def iter_chunked(size):
+                for start in range(0, len(body), size):
+                    yield body[start : start + size]
+
+            response.content.iter_chunked = iter_chunked
+            return response
+
+        range_requests = []
+        full_responses = []
+
+        async def mock_get(url, headers=None):
+            byte_range = (headers or {}).get("Range")
+            if byte_range is None or range_status != 206:
+                response = serve(
+                    content,
+                    200,
+                    {"content-length": str(len(content)), "Accept-Ranges": "bytes"},
+                )
+                full_responses.append(response)
+                return response
+            # The full-body probe must not keep streaming alongside the ranges
+            assert all(r.release.await_count for r in full_responses)
+            range_requests.append(byte_range)
+            start, end = map(int, byte_range.removeprefix("bytes=").split("-"))
+            return serve(
+                content[start : end + 1],
+                206,
+                {"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+            )
+
+        return mock_get, range_requests
+
+    async def test_download_asset_fetches_ranges_in_parallel(self, tmp_path):
+        """Test a large download is split into ranged requests."""
+        import hashlib
+
+        from sysupdate.selfupdate import github
+
+        dest_file = tmp_path / "binary"
+        file_content = bytes(range(256)) * 4099
+        mock_get, range_requests = self._make_ranged_get(file_content)
+        progress_calls = []
+
+        with (
+            patch("aiohttp.ClientSession") as mock_session_class,
+            patch.object(github, "PARALLEL_DOWNLOAD_MIN_BYTES", 1024),
+        ):
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = mock_get
+            mock_session.close = AsyncMock()
+
+            hasher = hashlib.sha256()
+            async with GitHubClient() as client:
+                success = await client.download_asset(
+                    "https://example.com/file",
+                    dest_file,
+                    lambda percent, message: progress_calls.append(percent),
+                    hasher=hasher,
+                )
+
+        assert success is True
+        assert dest_file.read_bytes() == file_content
+        assert hasher.hexdigest() == hashlib.sha256(file_content).hexdigest()
+        assert range_requests[0].startswith("bytes=0-")
+        assert len(range_requests) == github.DOWNLOAD_SEGMENTS
+        assert progress_calls[-1] == 100.0
+
+    async def test_download_asset_falls_back_without_range_support(self, tmp_path):
+        """Test a server ignoring Range gets a single-stream download."""
+        from sysupdate.selfupdate import github
+
+        dest_file = tmp_path / "binary"
+        file_content = bytes(range(256)) * 64
+        mock_get, _ = self._make_ranged_get(file_content, range_status=200)
+
+        with (
+            patch("aiohttp.ClientSession") as mock_session_class,
+            patch.object(github, "PARALLEL_DOWNLOAD_MIN_BYTES", 1024),
+        ):
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.get = mock_get
+            mock_session.close = AsyncMock()
+
+            async with GitHubClient() as client:
+                success = await client.download_asset(
+                    "https://example.com/file", dest_file
+                )
+
+        assert success is True
+        assert dest_file.read_bytes() == file_content
+
 
     async def test_download_asset_http_error(self, tmp_path):
         """Test download_asset handles HTTP errors."""
@@ -755,7 +1077,7 @@ class TestSelfUpdaterE2E:
 
             return mock_resp
 
-        async def mock_get(url):
+        async def mock_get(url, **kwargs):
             return create_mock_response(url)
 
         mock_session.get = mock_get
@@ -933,7 +1255,7 @@ class TestSelfUpdaterE2E:
 
                         return mock_resp
 
-                    async def mock_get(url):
+                    async def mock_get(url, **kwargs):
                         return create_mock_response(url)
 
                     mock_session.get = mock_get
@@ -1116,6 +1438,34 @@ class TestBinaryReplacement:
         # Backup should be removed
         assert not backup_path.exists()
 
+    async def test_replace_binary_cross_device_stages_copy(self, tmp_path):
+        """A cross-device rename falls back to copying next to the target."""
+        import errno
+
+        current_binary = tmp_path / "sysupdate"
+        current_binary.write_bytes(b"old")
+        new_binary = tmp_path / "new_binary"
+        new_binary.write_bytes(b"new")
+
+        real_replace = os.replace
+        calls = []
+
+        def fake_replace(src, dst):
+            calls.append((Path(src), Path(dst)))
+            if Path(src) == new_binary:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return real_replace(src, dst)
+
+        with patch("os.replace", side_effect=fake_replace):
+            success, error = await replace_binary(current_binary, new_binary)
+
+        assert success, f"Replacement failed: {error}"
+        assert current_binary.read_bytes() == b"new"
+        assert current_binary.stat().st_mode & 0o111
+        assert not new_binary.exists()
+        assert calls[-1] == (tmp_path / ".sysupdate.new", current_binary)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["sysupdate"]
+
     def test_can_write_to_path_writable(self, tmp_path):
         """Test can_write_to_path returns True for writable paths."""
         test_file = tmp_path / "test"
@@ -1130,3 +1480,81 @@ class TestBinaryReplacement:
 
         # Parent (tmp_path) is writable, so this should return True
         assert can_write_to_path(nonexistent) is True
+
+    def test_can_write_to_path_walks_up_missing_ancestors(self, tmp_path):
+        """Test can_write_to_path checks the nearest existing ancestor."""
+        nested = tmp_path / "a" / "b" / "sysupdate"
+        assert can_write_to_path(nested) is True
+
+        read_only = tmp_path / "ro"
+        read_only.mkdir()
+        with patch("os.access", return_value=False) as mock_access:
+            assert can_write_to_path(read_only / "x" / "sysupdate") is False
+        mock_access.assert_called_once_with(str(read_only), os.W_OK)
+
+
+class TestReplaceWithSudo:
+    """Tests for the privileged replacement path."""
+
+    @pytest.fixture
+    def run_without_sudo(self):
+        """Run the sudo script with plain sh, recording each spawned command."""
+        calls = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def fake_exec(*args, **kwargs):
+            calls.append(args)
+            assert args[0] == "sudo"
+            return await real_exec(*args[1:], **kwargs)
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            yield calls
+
+    async def test_single_subprocess_replaces_binary(self, tmp_path, run_without_sudo):
+        """Backup, move and cleanup happen in one sudo invocation."""
+        from sysupdate.selfupdate.binary import _replace_with_sudo
+
+        current = tmp_path / "sys update"
+        current.write_bytes(b"old")
+        new = tmp_path / "new; rm -rf x"
+        new.write_bytes(b"new")
+        backup = current.with_suffix(".bak")
+
+        success, error = await _replace_with_sudo(current, new, backup)
+
+        assert success, error
+        assert len(run_without_sudo) == 1
+        assert current.read_bytes() == b"new"
+        assert not new.exists()
+        assert not backup.exists()
+
+    async def test_failed_move_restores_backup(self, tmp_path, run_without_sudo):
+        """A failed move restores the original and reports it."""
+        from sysupdate.selfupdate.binary import _replace_with_sudo
+
+        current = tmp_path / "sysupdate"
+        current.write_bytes(b"old")
+        backup = current.with_suffix(".bak")
+
+        success, error = await _replace_with_sudo(current, tmp_path / "missing", backup)
+
+        assert not success
+        assert error.startswith("Move failed:")
+        assert error.endswith("Backup restored.")
+        assert current.read_bytes() == b"old"
+        assert not backup.exists()
+
+    async def test_failed_backup_is_reported(self, tmp_path, run_without_sudo):
+        """A failed backup leaves everything untouched."""
+        from sysupdate.selfupdate.binary import _replace_with_sudo
+
+        new = tmp_path / "new"
+        new.write_bytes(b"new")
+
+        success, error = await _replace_with_sudo(
+            tmp_path / "missing", new, tmp_path / "missing.bak"
+        )
+
+        assert not success
+        assert error.startswith("Backup failed:")
+        assert new.exists()
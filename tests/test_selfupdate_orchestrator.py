@@ -186,6 +186,129 @@ class TestSelfUpdaterCheckForUpdate:
         assert result.release is release
 
 
+class TestSelfUpdaterPerformUpdate:
+    """Tests for SelfUpdater.perform_update() verification."""
+
+    async def test_checksum_mismatch_fails_before_replacing(self, tmp_path):
+        """A binary whose hash differs from SHA256SUMS.txt is never installed."""
+        release = _make_release()
+
+        async def fake_download(url, dest, progress, hasher=None):
+            dest.write_bytes(b"tampered")
+            hasher.update(b"tampered")
+            return True
+
+        updater = SelfUpdater()
+        mock_client = AsyncMock()
+        mock_client.download_text.return_value = f"{'0' * 64}  sysupdate-linux-x86_64\n"
+        mock_client.download_asset = fake_download
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        updater._github_client = mock_client
+
+        with (
+            patch(
+                "sysupdate.selfupdate.updater.get_binary_path",
+                return_value=tmp_path / "sysupdate",
+            ),
+            patch(
+                "sysupdate.selfupdate.updater.get_architecture", return_value="x86_64"
+            ),
+            patch("sysupdate.selfupdate.updater.replace_binary") as mock_replace,
+        ):
+            result = await updater.perform_update("1.0.0", release)
+
+        assert result.success is False
+        assert "Checksum verification failed" in result.error_message
+        mock_replace.assert_not_called()
+
+    async def test_checksums_fetched_while_binary_downloads(self, tmp_path):
+        """The checksum request does not wait for the binary download."""
+        import asyncio
+
+        release = _make_release()
+        download_started = asyncio.Event()
+        checksums_fetched = asyncio.Event()
+
+        async def fake_download(url, dest, progress, hasher=None):
+            download_started.set()
+            await checksums_fetched.wait()
+            dest.write_bytes(b"binary")
+            return True
+
+        async def fake_download_text(url):
+            await download_started.wait()
+            checksums_fetched.set()
+            return f"{'0' * 64}  sysupdate-linux-x86_64\n"
+
+        updater = SelfUpdater()
+        mock_client = AsyncMock()
+        mock_client.download_text = fake_download_text
+        mock_client.download_asset = fake_download
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        updater._github_client = mock_client
+
+        with (
+            patch(
+                "sysupdate.selfupdate.updater.get_binary_path",
+                return_value=tmp_path / "sysupdate",
+            ),
+            patch(
+                "sysupdate.selfupdate.updater.get_architecture", return_value="x86_64"
+            ),
+        ):
+            result = await asyncio.wait_for(
+                updater.perform_update("1.0.0", release), timeout=5
+            )
+
+        # Both transfers overlapped; the run then fails on the dummy hash
+        assert "Checksum verification failed" in result.error_message
+
+    async def test_missing_checksum_cancels_download(self, tmp_path):
+        """Without a checksum entry the in-flight download is cancelled."""
+        import asyncio
+
+        release = _make_release()
+        cancelled = False
+
+        async def fake_download(url, dest, progress, hasher=None):
+            nonlocal cancelled
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def fake_download_text(url):
+            # A real request yields to the loop, letting the download start
+            await asyncio.sleep(0)
+            return f"{'0' * 64}  other-asset\n"
+
+        updater = SelfUpdater()
+        mock_client = AsyncMock()
+        mock_client.download_text = fake_download_text
+        mock_client.download_asset = fake_download
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=False)
+        updater._github_client = mock_client
+
+        with (
+            patch(
+                "sysupdate.selfupdate.updater.get_binary_path",
+                return_value=tmp_path / "sysupdate",
+            ),
+            patch(
+                "sysupdate.selfupdate.updater.get_architecture", return_value="x86_64"
+            ),
+        ):
+            result = await updater.perform_update("1.0.0", release)
+
+        assert result.success is False
+        assert "No checksum found" in result.error_message
+        assert cancelled
+
+
 # ---------------------------------------------------------------------------
 # run_self_update orchestrator tests
 # ---------------------------------------------------------------------------
@@ -212,6 +335,9 @@ class TestRunSelfUpdate:
 
         assert result == 0
         mock_updater.check_for_update.assert_awaited_once()
+        # The check runs inside the updater's shared-session context
+        mock_updater.__aenter__.assert_awaited_once()
+        mock_updater.__aexit__.assert_awaited_once()
 
     @patch("sysupdate.selfupdate.Console")
     @patch("sysupdate.selfupdate.SelfUpdater")
@@ -0,0 +1,107 @@
+"""Tests for the persistent tool-availability cache."""
+
+import json
+import stat
+import time
+from unittest.mock import AsyncMock, patch
+
+from sysupdate.utils.toolcache import (
+    TOOL_CACHE_TTL_SECONDS,
+    clear_tool_cache,
+    get_or_probe,
+    get_tool_cache_path,
+)
+
+
+class TestGetOrProbe:
+    """Tests for get_or_probe."""
+
+    async def test_probes_and_caches_on_miss(self):
+        """A miss runs the probe and persists the result to disk."""
+        probe = AsyncMock(return_value=True)
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=123.0):
+            assert await get_or_probe("apt", probe) is True
+
+        probe.assert_awaited_once()
+        data = json.loads(get_tool_cache_path().read_text())
+        assert data["apt"]["available"] is True
+        assert data["apt"]["mtime"] == 123.0
+        assert stat.S_IMODE(get_tool_cache_path().stat().st_mode) == 0o600
+
+    async def test_hit_skips_probe_across_processes(self):
+        """A fresh process (cleared memory) reuses the on-disk entry."""
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=123.0):
+            await get_or_probe("apt", AsyncMock(return_value=True))
+            clear_tool_cache()
+
+            probe = AsyncMock(return_value=False)
+            assert await get_or_probe("apt", probe) is True
+
+        probe.assert_not_awaited()
+
+    async def test_mtime_change_invalidates(self):
+        """Upgrading the binary (new mtime) forces a re-probe."""
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=123.0):
+            await get_or_probe("apt", AsyncMock(return_value=True))
+
+        probe = AsyncMock(return_value=False)
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=456.0):
+            assert await get_or_probe("apt", probe) is False
+
+        probe.assert_awaited_once()
+
+    async def test_expired_entry_is_reprobed(self):
+        """Entries older than the TTL are not trusted."""
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=123.0):
+            await get_or_probe("apt", AsyncMock(return_value=True))
+
+            probe = AsyncMock(return_value=True)
+            future = time.time() + TOOL_CACHE_TTL_SECONDS + 1
+            with patch("sysupdate.utils.toolcache.time.time", return_value=future):
+                await get_or_probe("apt", probe)
+
+        probe.assert_awaited_once()
+
+    async def test_missing_binary_is_probed_and_not_cached(self):
+        """Tools not on PATH are always probed and never written to disk."""
+        probe = AsyncMock(return_value=False)
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=None):
+            assert await get_or_probe("pacman", probe) is False
+
+        probe.assert_awaited_once()
+        assert not get_tool_cache_path().exists()
+
+    async def test_corrupt_cache_file_is_ignored(self):
+        """A corrupt cache file is treated as empty."""
+        path = get_tool_cache_path()
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        probe = AsyncMock(return_value=True)
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=1.0):
+            assert await get_or_probe("snap", probe) is True
+
+        probe.assert_awaited_once()
+
+    async def test_malformed_entries_are_reprobed_and_overwritten(self):
+        """Valid JSON with the wrong shape is a miss, not an error."""
+        path = get_tool_cache_path()
+        path.parent.mkdir(parents=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "aria2c": ["bad"],
+                    "apt": {"mtime": 1.0, "checked_at": "x", "available": True},
+                }
+            )
+        )
+
+        probe = AsyncMock(return_value=True)
+        with patch("sysupdate.utils.toolcache._binary_mtime", return_value=1.0):
+            assert await get_or_probe("aria2c", probe) is True
+            assert await get_or_probe("apt", probe) is True
+
+        assert probe.await_count == 2
+        data = json.loads(path.read_text())
+        assert data["aria2c"]["available"] is True
+        assert isinstance(data["apt"]["checked_at"], float)
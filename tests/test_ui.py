@@ -3,7 +3,7 @@
 from rich.progress import Progress
 from rich.progress import Task as RichTask
 
-from sysupdate.ui import GradientBarColumn, StatusColumn
+from sysupdate.ui import DescriptionColumn, GradientBarColumn, StatusColumn
 
 
 def make_task(total=None, completed=0, **fields) -> RichTask:
@@ -26,6 +26,13 @@ class TestGradientBarColumn:
         hex_spans = [s for s in bar.spans if "#" in str(s.style)]
         assert len(hex_spans) == 8
 
+    def test_track_is_a_single_dim_run(self):
+        column = GradientBarColumn(bar_width=16)
+        bar = column.render(make_task(total=100, completed=25))
+        dim_spans = [s for s in bar.spans if str(s.style) == "dim"]
+        assert len(dim_spans) == 1
+        assert dim_spans[0].end - dim_spans[0].start == 12
+
     def test_indeterminate_is_fully_styled(self):
         column = GradientBarColumn(bar_width=16)
         bar = column.render(make_task(total=None))
@@ -88,3 +95,28 @@ class TestStatusColumn:
         assert column.render(task).plain == "+"
         text = column.render(make_task(total=100, phase="installing"))
         assert text.plain == "*"
+
+    def test_phase_badges_are_reused(self):
+        column = StatusColumn()
+        task = make_task(total=100, phase="downloading")
+        assert column.render(task) is column.render(task)
+
+
+class TestDescriptionColumn:
+    """Markup-rendered task descriptions."""
+
+    def test_renders_markup(self):
+        column = DescriptionColumn()
+        progress = Progress()
+        progress.add_task("[bold]APT[/] [dim]checking[/]", total=None)
+        text = column.render(progress.tasks[0])
+        assert text.plain == "APT checking"
+        assert {str(span.style) for span in text.spans} == {"bold", "dim"}
+
+    def test_same_description_parsed_once(self):
+        column = DescriptionColumn()
+        progress = Progress()
+        progress.add_task("[bold]Snap[/]", total=None)
+        progress.add_task("[bold]Snap[/]", total=None)
+        first, second = progress.tasks
+        assert column.render(first) is column.render(second)
@@ -82,35 +82,27 @@ class TestAptUpdater:
 
     async def test_check_available_true(self, updater):
         """Test check_available when apt exists."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 0
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value="/usr/bin/tool"):
             result = await updater.check_available()
             assert result is True
 
 
     async def test_check_available_false(self, updater):
         """Test check_available when apt doesn't exist."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 1
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value=None):
             result = await updater.check_available()
             assert result is False
 
 
-    async def test_check_available_exception(self, updater):
-        """Test check_available handles exceptions."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_exec.side_effect = Exception("Command not found")
-
+    async def test_check_available_spawns_no_process(self, updater):
+        """Test check_available is a PATH lookup, not a subprocess."""
+        with (
+            patch("asyncio.create_subprocess_exec") as mock_exec,
+            patch("sysupdate.utils.shutil.which", return_value="/usr/bin/apt"),
+        ):
             result = await updater.check_available()
-            assert result is False
+            assert result is True
+            mock_exec.assert_not_called()
 
 
     async def test_check_updates(self, updater):
@@ -183,24 +175,14 @@ class TestFlatpakUpdater:
 
     async def test_check_available_true(self, updater):
         """Test check_available when flatpak exists."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 0
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value="/usr/bin/tool"):
             result = await updater.check_available()
             assert result is True
 
 
     async def test_check_available_false(self, updater):
         """Test check_available when flatpak doesn't exist."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 1
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value=None):
             result = await updater.check_available()
             assert result is False
 
@@ -274,24 +256,14 @@ class TestSnapUpdater:
 
     async def test_check_available_true(self, updater):
         """Test check_available when snap exists."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 0
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value="/usr/bin/tool"):
             result = await updater.check_available()
             assert result is True
 
 
     async def test_check_available_false(self, updater):
         """Test check_available when snap doesn't exist."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 1
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value=None):
             result = await updater.check_available()
             assert result is False
 
@@ -388,24 +360,14 @@ class TestPacmanUpdater:
 
     async def test_check_available_true(self, updater):
         """Test check_available when pacman exists."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 0
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value="/usr/bin/tool"):
             result = await updater.check_available()
             assert result is True
 
 
     async def test_check_available_false(self, updater):
         """Test check_available when pacman doesn't exist."""
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = AsyncMock()
-            mock_proc.returncode = 1
-            mock_proc.wait = AsyncMock()
-            mock_exec.return_value = mock_proc
-
+        with patch("sysupdate.utils.shutil.which", return_value=None):
             result = await updater.check_available()
             assert result is False
 
@@ -416,7 +378,7 @@ class TestPacmanUpdater:
 firefox 122.0-1 -> 122.0.1-1
 python 3.11.7-1 -> 3.11.8-1
 """
-        with patch("sysupdate.updaters.pacman.command_available") as mock_avail:
+        with patch("sysupdate.updaters.pacman.has_tool") as mock_avail:
             mock_avail.return_value = True  # checkupdates is available
 
             with patch("asyncio.create_subprocess_exec") as mock_exec:
@@ -438,7 +400,7 @@ python 3.11.7-1 -> 3.11.8-1
         pacman_output = b"""linux 6.7.1-1
 firefox 122.0.1-1
 """
-        with patch("sysupdate.updaters.pacman.command_available") as mock_avail:
+        with patch("sysupdate.updaters.pacman.has_tool") as mock_avail:
             mock_avail.return_value = False  # checkupdates not available
 
             with patch("asyncio.create_subprocess_exec") as mock_exec:
@@ -455,7 +417,7 @@ firefox 122.0.1-1
 
     async def test_check_updates_empty(self, updater):
         """Test handling when no updates are available."""
-        with patch("sysupdate.updaters.pacman.command_available") as mock_avail:
+        with patch("sysupdate.updaters.pacman.has_tool") as mock_avail:
             mock_avail.return_value = True
 
             with patch("asyncio.create_subprocess_exec") as mock_exec:
@@ -477,7 +439,7 @@ firefox 122.0.1-1
         def track_progress(progress: UpdateProgress):
             progress_updates.append(progress)
 
-        with patch("sysupdate.updaters.pacman.command_available") as mock_avail:
+        with patch("sysupdate.updaters.pacman.has_tool") as mock_avail:
             mock_avail.return_value = True
 
             with patch("asyncio.create_subprocess_exec") as mock_exec:
@@ -512,3 +474,35 @@ firefox 122.0-1
     def test_name_attribute(self, updater):
         """Test that the updater has correct name."""
         assert updater.name == "Pacman Packages"
+
+
+class TestUpdatersPackage:
+    """Tests for the updaters package exports."""
+
+    def test_backends_are_exported(self):
+        """Backend classes are reachable from the package."""
+        from sysupdate import updaters
+
+        assert updaters.AptUpdater is AptUpdater
+        assert updaters.PacmanUpdater is PacmanUpdater
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names still raise AttributeError."""
+        from sysupdate import updaters
+
+        with pytest.raises(AttributeError):
+            updaters.NotAnUpdater  # noqa: B018
+
+    def test_base_import_skips_backends(self):
+        """Importing the shared data structures does not load the backends."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, sysupdate.summary; "
+            "print('sysupdate.updaters.apt' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
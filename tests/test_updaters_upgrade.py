@@ -336,7 +336,7 @@ class TestPacmanUpgrade:
         def track(p: UpdateProgress) -> None:
             progress_updates.append(p)
 
-        with patch("sysupdate.updaters.pacman.command_available", return_value=True):
+        with patch("sysupdate.updaters.pacman.has_tool", return_value=True):
             with patch("asyncio.create_subprocess_exec") as mock_exec:
                 mock_exec.side_effect = [
                     mock_check_proc,  # check_updates (checkupdates)
@@ -372,7 +372,7 @@ class TestPacmanUpgrade:
         def track(p: UpdateProgress) -> None:
             progress_updates.append(p)
 
-        with patch("sysupdate.updaters.pacman.command_available", return_value=True):
+        with patch("sysupdate.updaters.pacman.has_tool", return_value=True):
             with patch("asyncio.create_subprocess_exec") as mock_exec:
                 mock_exec.side_effect = [mock_check_proc]
                 with patch.object(updater, "_logger", MagicMock()):
@@ -404,7 +404,7 @@ class TestPacmanUpgrade:
         def track(p: UpdateProgress) -> None:
             progress_updates.append(p)
 
-        with patch("sysupdate.updaters.pacman.command_available", return_value=True):
+        with patch("sysupdate.updaters.pacman.has_tool", return_value=True):
             with patch("asyncio.create_subprocess_exec") as mock_exec:
                 mock_exec.side_effect = [
                     mock_check_proc,
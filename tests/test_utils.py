@@ -1,6 +1,8 @@
 """Tests for utility functions."""
 
-from sysupdate.utils import command_available
+from unittest.mock import patch
+
+from sysupdate.utils import command_available, has_tool, invalidate_cache
 
 
 class TestCommandAvailable:
@@ -93,3 +95,36 @@ class TestCommandAvailable:
         result2 = await command_available("nonexistent_command_99999")
         assert result2 is False
         assert result1 == result2
+
+
+class TestHasTool:
+    """Tests for has_tool function."""
+
+
+    def test_found_on_path(self):
+        """Test that an executable on PATH is reported as present."""
+        assert has_tool("ls") is True
+
+
+    def test_missing_from_path(self):
+        """Test that an unknown executable is reported as missing."""
+        assert has_tool("nonexistent_command_12345") is False
+
+
+    def test_lookup_is_cached(self):
+        """Test that repeated checks reuse the first PATH lookup."""
+        with patch("sysupdate.utils.shutil.which", return_value="/bin/ls") as mock:
+            assert has_tool("ls") is True
+            assert has_tool("ls") is True
+        mock.assert_called_once_with("ls")
+
+
+    def test_invalidate_cache_forgets_lookups(self):
+        """Test that invalidate_cache makes newly installed tools visible."""
+        with patch("sysupdate.utils.shutil.which", return_value=None):
+            assert has_tool("aria2c") is False
+
+        invalidate_cache("aria2c")
+
+        with patch("sysupdate.utils.shutil.which", return_value="/usr/bin/aria2c"):
+            assert has_tool("aria2c") is True